@@ -0,0 +1,84 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Helpers shared by the benchmarks.
+
+Benchmarks are plain scripts, run them from the repository root, e.g. ``python benchmarks/responses.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Sequence
+
+ROOT = Path(__file__).parents[1]
+""" Root of the repository """
+
+
+def load_module(name: str, path: str) -> ModuleType:
+    """
+    Load a module of the repository by its path.
+
+    Importing through the ``dialect.providers`` package needs gi, modules without internal imports
+    can be loaded alone this way.
+
+    Args:
+        name: Name to register the module with.
+        path: Path of the module file, relative to the repository root.
+    """
+    spec = importlib.util.spec_from_file_location(name, ROOT / path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    sys.modules[name] = module
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def measure(func: Callable[[], Any], number: int = 100, repeat: int = 5) -> tuple[float, int]:
+    """
+    Measure a call.
+
+    Args:
+        func: The call.
+        number: Calls per timing run.
+        repeat: Number of timing runs, the fastest one is kept.
+
+    Returns:
+        The seconds per call and the peak bytes allocated during a single call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return best, peak
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print rows aligned in columns."""
+    cells = [[str(cell) for cell in row] for row in [headers, *rows]]
+    widths = [max(len(row[column]) for row in cells) for column in range(len(headers))]
+
+    for index, row in enumerate(cells):
+        print(
+            "  ".join(
+                cell.rjust(width) if column else cell.ljust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            )
+        )
+        if index == 0:
+            print("  ".join("-" * width for width in widths))
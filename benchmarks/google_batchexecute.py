@@ -0,0 +1,59 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Time per response of the Google batchexecute parser, against the previous character walking parser.
+
+Responses are built like Google's for texts of several sizes, with and without non-ASCII characters,
+which make the frames fall back to ``json.JSONDecoder.raw_decode``.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from _common import load_module, measure, print_table
+
+# Reuse the responses and the reference parser of the correctness tests
+tests = load_module("test_google_batchexecute", "tests/test_google_batchexecute.py")
+
+TEXTS = {
+    "ascii": "The quick brown fox jumps over the lazy dog. ",
+    "latin": "Le vif renard brun saute par-dessus le chien paresseux, à côté. ",
+    "cjk": "敏捷的棕色狐狸跳过了懒狗。",
+}
+SIZES = (100, 500, 2000, 5000)
+""" Text lengths in characters, 2000 is the usual provider limit """
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="responses per timing run")
+    args = parser.parse_args()
+
+    rows = []
+    for name, sample in TEXTS.items():
+        for size in SIZES:
+            text = (sample * (size // len(sample) + 1))[:size]
+            response = tests.build_response(text)
+            assert tests.parse_batchexecute(response)[:3] == tests.reference_parse(response)
+
+            previous, _peak = measure(lambda: tests.reference_parse(response), args.number)  # noqa: B023
+            current, _peak = measure(lambda: tests.parse_batchexecute(response), args.number)  # noqa: B023
+            rows.append(
+                (
+                    name,
+                    size,
+                    len(response),
+                    f"{previous * 1e6:.1f}",
+                    f"{current * 1e6:.1f}",
+                    f"{previous / current:.1f}x",
+                )
+            )
+
+    print(f"JSON backend: {tests.jsonlib.BACKEND}\n")
+    print_table(("text", "chars", "bytes", "previous us", "current us", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
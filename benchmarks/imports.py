@@ -0,0 +1,93 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Import time of the app and the search provider, with the lazy providers manifest and with every
+provider module imported, as before the manifest.
+
+Each measure runs in a fresh interpreter. Dialect must be installed, e.g. with
+``meson setup build --prefix ~/.local && ninja -C build install``, as ``dialect.define``,
+the translations and the GResource are generated at build time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from _common import print_table
+
+SETUP = """
+import gettext, os, sys, time
+sys.path.insert(1, {pkgdatadir!r})
+gettext.install("dialect", names=["gettext"])
+
+from gi.repository import Gio
+resource = os.path.join({pkgdatadir!r}, "dialect.gresource")
+if os.path.exists(resource):
+    Gio.Resource.load(resource)._register()
+
+start = time.perf_counter()
+"""
+
+TARGETS = {
+    "app": "import dialect.main",
+    # The search provider script imports
+    "search provider": 'import gi\ngi.require_version("Secret", "1")\ngi.require_version("Soup", "3.0")\n'
+    "import dialect.asyncio, dialect.providers, dialect.settings",
+}
+
+EAGER = """
+from dialect.providers import MODULES
+for entry in MODULES.values():
+    entry.load()
+"""
+
+REPORT = """
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def run(code: str) -> tuple[float, int]:
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if process.returncode != 0:
+        sys.exit(process.stderr)
+
+    seconds, modules = process.stdout.split()
+    return float(seconds), int(modules)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--pkgdatadir",
+        default=os.path.expanduser("~/.local/share/dialect"),
+        help="directory where the dialect package and its GResource are installed",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="interpreters started per measure")
+    args = parser.parse_args()
+
+    setup = SETUP.format(pkgdatadir=args.pkgdatadir)
+    rows = []
+    for target, statement in TARGETS.items():
+        for providers, extra in (("lazy", ""), ("all imported", EAGER)):
+            results = [run(setup + statement + extra + REPORT) for _ in range(args.runs)]
+            times = [seconds for seconds, _modules in results]
+            rows.append(
+                (
+                    target,
+                    providers,
+                    f"{statistics.median(times) * 1000:.1f}",
+                    f"{min(times) * 1000:.1f}",
+                    results[0][1],
+                )
+            )
+
+    print_table(("target", "providers", "median ms", "min ms", "modules"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Languages bookkeeping of a provider supporting 250 languages, before and after ``LanguageRegistry``.
+
+The previous bookkeeping kept plain lists, rebuilt the aliases map on every normalization and split
+codes on every comparison. Both implementations mirror the ``BaseProvider`` methods using them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools
+import string
+
+from _common import ROOT, load_module, measure, print_table
+
+registry = load_module("registry", "dialect/providers/registry.py")
+
+_define: dict = {}
+exec((ROOT / "dialect" / "define.in").read_text(), _define)
+LANG_ALIASES: dict[str, str] = _define["LANG_ALIASES"]
+
+
+def provider_codes(count: int = 250) -> list[str]:
+    """Lang codes like services return them, some with regions or scripts and not normalized."""
+    bases = ["".join(pair) for pair in itertools.product(string.ascii_lowercase, repeat=2)][:count]
+    codes = []
+    for index, base in enumerate(bases):
+        if index % 10 == 0:
+            codes.append(f"{base}_{base.upper()}")
+        elif index % 25 == 0:
+            codes.append(f"{base}-HANT")
+        else:
+            codes.append(base)
+    return codes
+
+
+def normalize(code: str, aliases: dict[str, str]) -> str:
+    code = code.replace("_", "-").lower()
+    codes = code.split("-")
+
+    if len(codes) == 2:
+        if len(codes[1]) == 4:
+            codes[1] = codes[1].capitalize()
+        elif len(codes[1]) == 2:
+            codes[1] = codes[1].upper()
+        code = "-".join(codes)
+
+    return aliases.get(code, code)
+
+
+class ListLanguages:
+    """The previous bookkeeping."""
+
+    lang_aliases: dict[str, str] = {}
+
+    def __init__(self):
+        self.src_languages: list[str] = []
+        self.dest_languages: list[str] = []
+        self._nonstandard_langs: dict[str, str] = {}
+
+    def normalize_lang_code(self, code: str) -> str:
+        return normalize(code, {**LANG_ALIASES, **self.lang_aliases})
+
+    def add_lang(self, original_code: str) -> None:
+        code = self.normalize_lang_code(original_code)
+        self.src_languages.append(code)
+        self.dest_languages.append(code)
+        if code != original_code and code not in self._nonstandard_langs:
+            self._nonstandard_langs[code] = original_code
+
+    def denormalize_lang(self, *codes: str) -> tuple[str, ...]:
+        return tuple(self._nonstandard_langs.get(code, code) for code in codes)
+
+    def cmp_langs(self, a: str, b: str) -> bool:
+        if a == b:
+            return True
+        return a.split("-")[0] == b.split("-")[0]
+
+
+class RegistryLanguages:
+    """The current bookkeeping."""
+
+    lang_aliases: dict[str, str] = {}
+
+    def __init__(self):
+        self.languages = registry.LanguageRegistry()
+
+    @property
+    def src_languages(self):
+        return self.languages.src
+
+    @functools.cached_property
+    def _aliases(self) -> dict[str, str]:
+        return {**LANG_ALIASES, **self.lang_aliases}
+
+    def normalize_lang_code(self, code: str) -> str:
+        if (normalized := self.languages.get_normalized(code)) is not None:
+            return normalized
+
+        normalized = normalize(code, self._aliases)
+        self.languages.set_normalized(code, normalized)
+        return normalized
+
+    def add_lang(self, original_code: str) -> None:
+        code = self.normalize_lang_code(original_code)
+        self.languages.src.add(code)
+        self.languages.dest.add(code)
+        if code != original_code and code not in self.languages.nonstandard:
+            self.languages.nonstandard[code] = original_code
+
+    def denormalize_lang(self, *codes: str) -> tuple[str, ...]:
+        return tuple(self.languages.denormalize(code) for code in codes)
+
+    def cmp_langs(self, a: str, b: str) -> bool:
+        if a == b:
+            return True
+        return self.languages.parts(a).base == self.languages.parts(b).base
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="runs of each operation per timing run")
+    args = parser.parse_args()
+
+    codes = provider_codes()
+    rows = []
+
+    for implementation in (ListLanguages, RegistryLanguages):
+        provider = implementation()
+        for code in codes:
+            provider.add_lang(code)
+        normalized = list(provider.src_languages)
+        recent = normalized[-10:]
+
+        def load():
+            fresh = implementation()  # noqa: B023
+            for code in codes:
+                fresh.add_lang(code)
+
+        operations = {
+            "add_lang x250": load,
+            "membership x250": lambda: [code in provider.src_languages for code in normalized],  # noqa: B023
+            "normalize x250": lambda: [provider.normalize_lang_code(code) for code in codes],  # noqa: B023
+            "denormalize x250": lambda: provider.denormalize_lang(*normalized),  # noqa: B023
+            "cmp_langs x2500": lambda: [provider.cmp_langs(a, b) for a in normalized for b in recent],  # noqa: B023
+        }
+        for operation, func in operations.items():
+            seconds, _peak = measure(func, args.number)
+            rows.append((operation, implementation.__name__, f"{seconds * 1e6:.1f}"))
+
+    rows.sort(key=lambda row: row[0])
+    print_table(("operation", "bookkeeping", "us"), rows)
+
+
+if __name__ == "__main__":
+    main()
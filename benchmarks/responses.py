@@ -0,0 +1,95 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Time and allocations per response of the typical provider payloads.
+
+The body is received in chunks like ``SoupProvider.send_and_stream`` yields them, then read into a
+single buffer, as ``SoupProvider.send_and_read`` does, or joined from a list of chunks, as it did before,
+and parsed with ``jsonlib.loads`` using orjson, if installed, and the stdlib.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from typing import Iterator
+
+from _common import load_module, measure, print_table
+
+jsonlib = load_module("jsonlib", "dialect/providers/jsonlib.py")
+
+STREAM_CHUNK_SIZE = 64 * 1024
+""" Same as ``dialect.providers.soup.STREAM_CHUNK_SIZE`` """
+
+TEXT = "Le vif renard brun saute par-dessus le chien paresseux, à côté de l'église. " * 26
+""" A translation near the 2000 chars limit of most providers """
+
+
+def build_payloads() -> dict[str, bytes]:
+    rng = random.Random(0)
+    payloads = {
+        "deepl": {"translations": [{"detected_source_language": "EN", "text": TEXT}]},
+        "libretrans": {"translatedText": TEXT, "detectedLanguage": {"confidence": 90.0, "language": "en"}},
+        "lingva": {"translation": TEXT, "info": {"detectedSource": "en", "pronunciation": {"query": TEXT}}},
+        "yandex": {"align": [f"{i};{i}" for i in range(0, 2000, 7)], "code": 200, "lang": "en-fr", "text": [TEXT]},
+        # Lingva returns the audio as a list of bytes, around 30 seconds of speech
+        "lingva-audio": {"audio": [rng.randrange(256) for _ in range(240_000)]},
+    }
+    return {name: json.dumps(payload, ensure_ascii=False).encode() for name, payload in payloads.items()}
+
+
+def stream(payload: bytes) -> Iterator[bytes]:
+    """Yield the payload in chunks, copied like ``GLib.Bytes.get_data`` does."""
+    for start in range(0, len(payload), STREAM_CHUNK_SIZE):
+        yield payload[start : start + STREAM_CHUNK_SIZE]
+
+
+def read_joined(payload: bytes) -> bytes:
+    return b"".join([chunk for chunk in stream(payload)])
+
+
+def read_buffer(payload: bytes) -> bytearray:
+    body = bytearray()
+    for chunk in stream(payload):
+        body += chunk
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=50, help="responses per timing run")
+    args = parser.parse_args()
+
+    orjson = jsonlib.orjson
+    backends = {"stdlib": None} if orjson is None else {"orjson": orjson, "stdlib": None}
+    if orjson is None:
+        print("orjson isn't installed, only the stdlib backend is measured\n")
+
+    rows = []
+    for name, payload in build_payloads().items():
+        for read in (read_joined, read_buffer):
+            _seconds, read_peak = measure(lambda: read(payload), 1, 1)  # noqa: B023
+
+            for backend, module in backends.items():
+                jsonlib.orjson = module
+                seconds, peak = measure(lambda: jsonlib.loads(read(payload)), args.number)  # noqa: B023
+                rows.append(
+                    (
+                        name,
+                        f"{len(payload) / 1024:.1f}",
+                        read.__name__,
+                        backend,
+                        f"{seconds * 1e6:.1f}",
+                        f"{read_peak / 1024:.1f}",
+                        f"{peak / 1024:.1f}",
+                    )
+                )
+
+    jsonlib.orjson = orjson
+    print_table(("payload", "size KiB", "read", "json", "us/response", "read peak KiB", "peak KiB"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Latency of concurrent translations while slow TTS downloads are in flight, against a local stub server.
+
+Compares a single session shared by every request, with libsoup default limits, as Dialect used before,
+with isolated sessions per provider, using the ``SoupProvider`` connection limits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import gi
+
+gi.require_version("Soup", "3.0")
+
+from _common import print_table
+from gi.events import GLibEventLoopPolicy
+from gi.repository import GLib, Soup
+
+MAX_CONNS = 10
+""" Same as ``SoupProvider.max_conns`` """
+MAX_CONNS_PER_HOST = 6
+""" Same as ``SoupProvider.max_conns_per_host`` """
+IDLE_TIMEOUT = 60
+""" Same as ``SoupProvider.idle_timeout`` """
+
+TRANSLATION = b'{"translatedText": "' + b"texte traduit " * 100 + b'"}'
+AUDIO = bytes(256 * 1024)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    translate_delay = 0.02
+    tts_delay = 1.0
+
+    def do_GET(self):
+        if self.path.startswith("/tts"):
+            time.sleep(self.tts_delay)
+            body = AUDIO
+        else:
+            time.sleep(self.translate_delay)
+            body = TRANSLATION
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def fetch(session: Soup.Session, url: str) -> float:
+    start = time.perf_counter()
+    message = Soup.Message.new("GET", url)
+    await session.send_and_read_async(message, GLib.PRIORITY_DEFAULT, None)  # type: ignore
+    if message.get_status() != Soup.Status.OK:
+        raise RuntimeError(f"Request to {url} failed with {message.get_status()}")
+    return time.perf_counter() - start
+
+
+async def run_scenario(
+    translate_session: Soup.Session, tts_session: Soup.Session, base_url: str, translations: int, tts: int
+) -> tuple[list[float], float]:
+    start = time.perf_counter()
+    downloads = [asyncio.ensure_future(fetch(tts_session, f"{base_url}/tts/{index}")) for index in range(tts)]
+
+    # Let the downloads take their connections first
+    await asyncio.sleep(0.05)
+    latencies = await asyncio.gather(
+        *(fetch(translate_session, f"{base_url}/translate/{index}") for index in range(translations))
+    )
+    await asyncio.gather(*downloads)
+
+    return list(latencies), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--translations", type=int, default=20, help="concurrent translations")
+    parser.add_argument("--tts", type=int, default=4, help="concurrent TTS downloads")
+    parser.add_argument("--tts-delay", type=float, default=1.0, help="seconds the server takes per TTS download")
+    parser.add_argument("--rounds", type=int, default=3, help="runs of each scenario")
+    args = parser.parse_args()
+
+    StubHandler.tts_delay = args.tts_delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def shared():
+        session = Soup.Session()
+        return session, session
+
+    def isolated():
+        limits = {"max_conns": MAX_CONNS, "max_conns_per_host": MAX_CONNS_PER_HOST, "idle_timeout": IDLE_TIMEOUT}
+        return Soup.Session(**limits), Soup.Session(**limits)
+
+    async def measure_all():
+        rows = []
+        for name, sessions in (("shared", shared), ("isolated", isolated)):
+            latencies: list[float] = []
+            walls: list[float] = []
+            for _ in range(args.rounds):
+                translate_session, tts_session = sessions()
+                round_latencies, wall = await run_scenario(
+                    translate_session, tts_session, base_url, args.translations, args.tts
+                )
+                latencies += round_latencies
+                walls.append(wall)
+
+            latencies.sort()
+            rows.append(
+                (
+                    name,
+                    f"{statistics.median(latencies) * 1000:.0f}",
+                    f"{latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}",
+                    f"{latencies[-1] * 1000:.0f}",
+                    f"{statistics.median(walls):.2f}",
+                )
+            )
+        return rows
+
+    asyncio.set_event_loop_policy(GLibEventLoopPolicy())
+    try:
+        rows = asyncio.run(measure_all())
+    finally:
+        server.shutdown()
+
+    print(f"{args.translations} translations while {args.tts} TTS downloads of {args.tts_delay}s are in flight\n")
+    print_table(("sessions", "p50 ms", "p95 ms", "max ms", "wall s"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 # Copyright 2021 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Callable
+from typing import Callable, Iterable
 
 from gi.repository import Gio, GObject
 
@@ -55,7 +55,7 @@ class LanguagesListModel(GObject.GObject, Gio.ListModel):
     def do_get_n_items(self) -> int:
         return len(self.langs)
 
-    def set_langs(self, langs: list[str], auto=False):
+    def set_langs(self, langs: Iterable[str], auto=False):
         removed = len(self.langs)
         self.langs.clear()
 
@@ -28,6 +28,10 @@ except ImportError or ValueError:
 
 from dialect.define import APP_ID, RES_PATH, VERSION
 from dialect.preferences import DialectPreferencesDialog
+from dialect.providers import TranslationCache
+from dialect.providers.cache import DiskCache
+from dialect.providers.local import LocalExecutor
+from dialect.providers.metrics import NetworkMetrics
 from dialect.settings import Settings
 from dialect.window import DialectWindow
 
@@ -105,6 +109,20 @@ class Dialect(Adw.Application):
 
         Gst.init(None)  # Init Gst
 
+        # Save translations on disk only if the user allows it
+        TranslationCache.get().persistent = Settings.get().save_translations
+        Settings.get().connect("changed::save-translations", self._on_save_translations_changed)
+
+    def do_shutdown(self):
+        # Stop local providers workers
+        LocalExecutor.shutdown_all()
+        # Save network metrics, if collected
+        NetworkMetrics.get().save()
+        # Write the queued cache changes
+        DiskCache.get().shutdown()
+
+        Adw.Application.do_shutdown(self)
+
     def process_command_line(self):
         if not self.argv:
             return
@@ -175,6 +193,15 @@ class Dialect(Adw.Application):
         if self.window:
             self.window._check_pronunciation()
 
+    def _on_save_translations_changed(self, _settings, _key):
+        """Called on Settings::changed::save-translations signal"""
+        cache = TranslationCache.get()
+        cache.persistent = Settings.get().save_translations
+
+        # Don't keep the translations already saved
+        if not cache.persistent:
+            cache.disk.clear()
+
     def _on_preferences(self, _action, _param):
         """Show preferences window"""
         if self.window:
@@ -11,7 +11,7 @@ import typing
 from gi.repository import Adw, Gio, Gtk
 
 from dialect.define import RES_PATH
-from dialect.providers import MODULES, TTS, ProviderFeature, ProvidersListModel
+from dialect.providers import MODULES, TTS, ProviderFeature, ProvidersListModel, TranslationCache
 from dialect.settings import Settings
 from dialect.widgets import ProviderPreferences
 
@@ -30,6 +30,7 @@ class DialectPreferencesDialog(Adw.PreferencesDialog):
     search_provider: Adw.SwitchRow = Gtk.Template.Child()  # type: ignore
     translate_accel: Adw.ComboRow = Gtk.Template.Child()  # type: ignore
     src_auto: Adw.SwitchRow = Gtk.Template.Child()  # type: ignore
+    save_translations: Adw.SwitchRow = Gtk.Template.Child()  # type: ignore
     translator: Adw.ComboRow = Gtk.Template.Child()  # type: ignore
     translator_config: Gtk.Button = Gtk.Template.Child()  # type: ignore
     tts: Adw.ComboRow = Gtk.Template.Child()  # type: ignore
@@ -49,6 +50,7 @@ class DialectPreferencesDialog(Adw.PreferencesDialog):
         Settings.get().bind("sp-translation", self.search_provider, "active", Gio.SettingsBindFlags.DEFAULT)
         Settings.get().bind("translate-accel", self.translate_accel, "selected", Gio.SettingsBindFlags.DEFAULT)
         Settings.get().bind("src-auto", self.src_auto, "active", Gio.SettingsBindFlags.DEFAULT)
+        Settings.get().bind("save-translations", self.save_translations, "active", Gio.SettingsBindFlags.DEFAULT)
         Settings.get().bind(
             "custom-default-font-size", self.custom_default_font_size, "enable-expansion", Gio.SettingsBindFlags.DEFAULT
         )
@@ -133,6 +135,12 @@ class DialectPreferencesDialog(Adw.PreferencesDialog):
         else:
             button.props.tooltip_text = _("No Settings for This Provider")
 
+    @Gtk.Template.Callback()
+    def _clear_saved_translations(self, _row):
+        """Called on clear_saved_translations::activated signal"""
+        TranslationCache.get().clear()
+        self.add_toast(Adw.Toast(title=_("Saved translations cleared")))
+
     def _on_translator_loading(self, window: DialectWindow, _value):
         self.translator.props.sensitive = not window.translator_loading
         self.tts.props.sensitive = not window.translator_loading
@@ -2,13 +2,10 @@
 # Copyright 2021 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import importlib
 import logging
-import pkgutil
 
 from gi.repository import Gio, GObject
 
-from dialect.providers import modules
 from dialect.providers.base import (  # noqa
     BaseProvider,
     ProviderCapability,
@@ -18,32 +15,36 @@ from dialect.providers.base import (  # noqa
     TranslationPronunciation,
     TranslationRequest,
 )
+from dialect.providers.cache import STATE_TTL, TranslationCache  # noqa
 from dialect.providers.errors import (  # noqa
     APIKeyInvalid,
     APIKeyRequired,
     BatchSizeExceeded,
     CharactersLimitExceeded,
+    CircuitOpen,
     InvalidLangCode,
     ProviderError,
+    RequestCancelled,
     RequestError,
+    ResponseTooLarge,
     ServiceLimitReached,
     UnexpectedError,
 )
+from dialect.providers.manifest import MANIFEST, ProviderEntry
 
-MODULES: dict[str, type[BaseProvider]] = {}
-TRANSLATORS: dict[str, type[BaseProvider]] = {}
-TTS: dict[str, type[BaseProvider]] = {}
-for _importer, modname, _ispkg in pkgutil.iter_modules(modules.__path__):
-    try:
-        modclass = importlib.import_module("dialect.providers.modules." + modname).Provider
-        MODULES[modclass.name] = modclass
-        if modclass.capabilities:
-            if ProviderCapability.TRANSLATION in modclass.capabilities:
-                TRANSLATORS[modclass.name] = modclass
-            if ProviderCapability.TTS in modclass.capabilities:
-                TTS[modclass.name] = modclass
-    except Exception as exc:
-        logging.warning(f"Could not load the {modname} provider: {exc}")
+MODULES: dict[str, ProviderEntry] = {}
+TRANSLATORS: dict[str, ProviderEntry] = {}
+TTS: dict[str, ProviderEntry] = {}
+for entry in MANIFEST:
+    if not entry.available:
+        logging.warning(f"Could not load the {entry.name} provider: missing {', '.join(entry.requires)}")
+        continue
+
+    MODULES[entry.name] = entry
+    if ProviderCapability.TRANSLATION in entry.capabilities:
+        TRANSLATORS[entry.name] = entry
+    if ProviderCapability.TTS in entry.capabilities:
+        TTS[entry.name] = entry
 
 
 def check_translator_availability(provider_name: str) -> bool:
@@ -61,7 +62,7 @@ def get_fallback_translator_name() -> str:
 class ProviderObject(GObject.Object):
     __gtype_name__ = "ProviderObject"
 
-    def __init__(self, p_class: type[BaseProvider] | None = None):
+    def __init__(self, p_class: ProviderEntry | None = None):
         super().__init__()
 
         self.p_class = p_class
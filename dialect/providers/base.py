@@ -2,14 +2,28 @@
 # Copyright 2021 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import asyncio
+import functools
+import json
+import logging
 import urllib.parse
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from enum import Enum, Flag, auto
-from typing import IO
+from typing import IO, Any, Awaitable, Callable, Literal
+
+from gi.repository import Gio
 
 from dialect.define import LANG_ALIASES
 from dialect.languages import get_lang_name
+from dialect.providers.breaker import CircuitBreaker
+from dialect.providers.cache import STATE_VERSION, DiskCache, TranslationCache
+from dialect.providers.cancellable import gather_or_cancel
+from dialect.providers.errors import BatchSizeExceeded
+from dialect.providers.registry import LanguageRegistry, LanguageSet
+from dialect.providers.segments import join_segments, split_text
 from dialect.providers.settings import ProviderDefaults, ProviderSettings
+from dialect.providers.singleflight import SingleFlight
 
 
 class ProviderCapability(Flag):
@@ -90,6 +104,61 @@ class Translation:
     pronunciation: TranslationPronunciation = field(default_factory=lambda: TranslationPronunciation(None, None))
 
 
+current_cancellable: ContextVar[Gio.Cancellable | None] = ContextVar("current_cancellable", default=None)
+""" Cancellable of the ongoing translation, used by providers HTTP helpers when none is given """
+
+
+def translation_pipeline(func: Callable[..., Awaitable[Translation]]):
+    """
+    Wraps a provider ``translate`` implementation so it runs through ``BaseProvider.run_translation``.
+
+    Applied automatically to ``translate`` by ``BaseProvider.__init_subclass__``.
+    """
+
+    if getattr(func, "_pipeline", False):
+        return func
+
+    @functools.wraps(func)
+    async def translate(
+        self: BaseProvider, request: TranslationRequest, cancellable: Gio.Cancellable | None = None
+    ) -> Translation:
+        token = current_cancellable.set(cancellable) if cancellable else None
+        try:
+            return await self.run_translation(functools.partial(func, self), request)
+        finally:
+            if token:
+                current_cancellable.reset(token)
+
+    translate._pipeline = True  # type: ignore
+    return translate
+
+
+def batch_translation_pipeline(func: Callable[..., Awaitable[list[Translation]]]):
+    """
+    Wraps a provider native ``translate_batch`` implementation so it runs through
+    ``BaseProvider.run_batch_translation``.
+
+    Applied automatically to ``translate_batch`` by ``BaseProvider.__init_subclass__``.
+    """
+
+    if getattr(func, "_pipeline", False):
+        return func
+
+    @functools.wraps(func)
+    async def translate_batch(
+        self: BaseProvider, requests: list[TranslationRequest], cancellable: Gio.Cancellable | None = None
+    ) -> list[Translation]:
+        token = current_cancellable.set(cancellable) if cancellable else None
+        try:
+            return await self.run_batch_translation(functools.partial(func, self), requests)
+        finally:
+            if token:
+                current_cancellable.reset(token)
+
+    translate_batch._pipeline = True  # type: ignore
+    return translate_batch
+
+
 class BaseProvider:
     name = ""
     """ Module name for code use, like settings storing """
@@ -103,6 +172,12 @@ class BaseProvider:
     """ Translation language model """
     lang_comp: ProviderLangComparison = ProviderLangComparison.PLAIN
     """ Define behavior of default `cmp_langs` method """
+    batch_size: int = -1
+    """ Max number of texts a native ``translate_batch`` accepts per request, -1 means unlimited """
+    batch_mixed_langs: bool = False
+    """ If a native ``translate_batch`` accepts requests with different lang pairs in the same batch """
+    batch_concurrency: int = 4
+    """ Max number of concurrent requests used for batches and segmented texts """
 
     defaults: ProviderDefaults = {
         "instance_url": "",
@@ -113,16 +188,9 @@ class BaseProvider:
     """ Default provider settings """
 
     def __init__(self):
-        self.src_languages: list[str] = []
-        """ Source languages available for translating """
-        self.dest_languages: list[str] = []
-        """ Destination languages available for translating """
-        self.tts_languages: list[str] = []
-        """ Languages available for TTS """
-        self._nonstandard_langs: dict[str, str] = {}
-        """ Mapping of lang codes that differ with Dialect ones """
-        self._languages_names: dict[str, str] = {}
-        """ Names of languages provided by the service """
+        self.languages = LanguageRegistry()
+        """ Languages supported by the provider, populated with ``BaseProvider.add_lang`` """
+        self._scratch_languages: LanguageRegistry | None = None
 
         self.chars_limit: int = -1
         """ Translation char limit """
@@ -133,6 +201,15 @@ class BaseProvider:
         # GSettings
         self.settings = ProviderSettings(self.name, self.defaults)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Route translations of every provider through the shared pipeline
+        if "translate" in cls.__dict__:
+            cls.translate = translation_pipeline(cls.__dict__["translate"])
+        if "translate_batch" in cls.__dict__:
+            cls.translate_batch = batch_translation_pipeline(cls.__dict__["translate_batch"])
+
     """
     Providers API methods
     """
@@ -169,21 +246,205 @@ class BaseProvider:
         """Initializes the provider text-to-speech capabilities."""
         raise NotImplementedError()
 
-    async def translate(self, request: TranslationRequest) -> Translation:
+    async def prewarm(self) -> None:
+        """
+        Prepares the provider connections ahead of the first request.
+
+        It's run next to ``BaseProvider.init_trans``, errors must be handled by the provider.
+        """
+
+    async def translate(self, request: TranslationRequest, cancellable: Gio.Cancellable | None = None) -> Translation:
         """
         Translates text in the provider.
 
         Providers are expected to use ``BaseProvider.denormalize_lang`` because
         ``request`` will use normalized lang codes.
 
+        Implementations only receive ``request``, ``cancellable`` is made available to the
+        ``SoupProvider`` HTTP helpers through ``current_cancellable``.
+
         Args:
             request: The translation request.
+            cancellable: Cancellable to abort the translation, ``RequestCancelled`` is raised then.
 
         Returns:
             A new translation object.
         """
         raise NotImplementedError()
 
+    async def run_translation(
+        self, translate: Callable[[TranslationRequest], Awaitable[Translation]], request: TranslationRequest
+    ) -> Translation:
+        """
+        Run a translation through the shared pipeline.
+
+        Translations are looked up and saved in ``TranslationCache`` before hitting the provider.
+        Identical concurrent requests share a single provider call through ``SingleFlight``.
+        Texts longer than ``self.chars_limit`` are segmented and translated with ``BaseProvider.translate_batch``.
+
+        Args:
+            translate: The provider ``translate`` implementation.
+            request: The translation request.
+
+        Returns:
+            A new translation object.
+        """
+        cache = TranslationCache.get()
+        key = cache.make_key(self, request)
+
+        if (translation := await cache.lookup(key, request)) is not None:
+            return translation
+
+        async def translate_and_store() -> Translation:
+            if self.chars_limit > 0 and len(request.text) > self.chars_limit:
+                translation = await self.translate_segmented(request)
+            else:
+                translation = await translate(request)
+            cache.store(key, translation)
+            return translation
+
+        translation = await SingleFlight.get().do(key, translate_and_store, current_cancellable.get())
+        if translation.original is not request:
+            translation = replace(translation, original=request)
+
+        return translation
+
+    async def translate_segmented(self, request: TranslationRequest) -> Translation:
+        """
+        Translates a text longer than ``self.chars_limit``.
+
+        The text is split at paragraph and sentence boundaries, segments are translated
+        concurrently and joined back in order keeping the original whitespace.
+
+        Args:
+            request: The translation request.
+
+        Returns:
+            A new translation object.
+        """
+        segments, separators = split_text(request.text, self.chars_limit)
+        translations = await self.translate_batch(
+            [TranslationRequest(segment, request.src, request.dest) for segment in segments]
+        )
+
+        detected = next((t.detected for t in translations if t.detected), None)
+        src_pronunciations = [t.pronunciation.src for t in translations]
+        dest_pronunciations = [t.pronunciation.dest for t in translations]
+
+        return Translation(
+            join_segments([t.text for t in translations], separators),
+            request,
+            detected,
+            pronunciation=TranslationPronunciation(
+                join_segments(src_pronunciations, separators) if all(src_pronunciations) else None,  # type: ignore
+                join_segments(dest_pronunciations, separators) if all(dest_pronunciations) else None,  # type: ignore
+            ),
+        )
+
+    async def translate_batch(
+        self, requests: list[TranslationRequest], cancellable: Gio.Cancellable | None = None
+    ) -> list[Translation]:
+        """
+        Translates several texts in the provider.
+
+        The default implementation runs ``BaseProvider.translate`` concurrently, with up to
+        ``self.batch_concurrency`` requests at the same time.
+
+        Providers with native batch support can override it. Their implementation will only
+        receive requests sharing the same ``src`` and ``dest``, unless ``self.batch_mixed_langs``,
+        no more than ``self.batch_size`` of them, and is expected to raise ``BatchSizeExceeded``
+        if the service rejects the size.
+
+        Args:
+            requests: The translation requests.
+            cancellable: Cancellable to abort the translations, ``RequestCancelled`` is raised then.
+
+        Returns:
+            The translations, in the same order as ``requests``.
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def translate(request: TranslationRequest, linked: Gio.Cancellable) -> Translation:
+            async with semaphore:
+                return await self.translate(request, linked)
+
+        return await gather_or_cancel(
+            (functools.partial(translate, request) for request in requests), cancellable or current_cancellable.get()
+        )
+
+    async def run_batch_translation(
+        self,
+        translate_batch: Callable[[list[TranslationRequest]], Awaitable[list[Translation]]],
+        requests: list[TranslationRequest],
+    ) -> list[Translation]:
+        """
+        Run a native batch translation through the shared pipeline.
+
+        Cached translations are reused, the remaining requests are grouped by lang pair,
+        unless ``self.batch_mixed_langs``, packed under ``self.batch_size`` and ``self.chars_limit``,
+        and split in halves when the provider raises ``BatchSizeExceeded``. Up to
+        ``self.batch_concurrency`` batches are sent at the same time.
+
+        Args:
+            translate_batch: The provider ``translate_batch`` implementation.
+            requests: The translation requests.
+
+        Returns:
+            The translations, in the same order as ``requests``.
+        """
+        cache = TranslationCache.get()
+        results: list[Translation | None] = [None] * len(requests)
+        groups: dict[tuple[str, str], list[tuple[int, str]]] = {}
+
+        for index, request in enumerate(requests):
+            key = cache.make_key(self, request)
+            if (translation := await cache.lookup(key, request)) is not None:
+                results[index] = translation
+            else:
+                pair = ("", "") if self.batch_mixed_langs else (request.src, request.dest)
+                groups.setdefault(pair, []).append((index, key))
+
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(batch: list[tuple[int, str]], linked: Gio.Cancellable):
+            # Only set in this batch task, the providers HTTP helpers pick it
+            current_cancellable.set(linked)
+            try:
+                async with semaphore:
+                    translations = await translate_batch([requests[index] for index, _key in batch])
+            except BatchSizeExceeded:
+                if len(batch) == 1:
+                    raise
+
+                middle = len(batch) // 2
+                await asyncio.gather(run(batch[:middle], linked), run(batch[middle:], linked))
+                return
+
+            for (index, key), translation in zip(batch, translations, strict=True):
+                cache.store(key, translation)
+                results[index] = translation
+
+        batches: list[list[tuple[int, str]]] = []
+        for group in groups.values():
+            batch: list[tuple[int, str]] = []
+            chars = 0
+            for index, key in group:
+                length = len(requests[index].text)
+                full = len(batch) == self.batch_size
+                too_long = self.chars_limit > 0 and chars + length > self.chars_limit
+                if batch and (full or too_long):
+                    batches.append(batch)
+                    batch, chars = [], 0
+                batch.append((index, key))
+                chars += length
+            if batch:
+                batches.append(batch)
+
+        # A failed batch fails the whole translation, so the others are cancelled right away
+        await gather_or_cancel((functools.partial(run, batch) for batch in batches), current_cancellable.get())
+
+        return results  # type: ignore
+
     async def suggest(self, text: str, src: str, dest: str, suggestion: str) -> bool:
         """
         Sends a translation suggestion to the provider.
@@ -252,14 +513,8 @@ class BaseProvider:
         if self.lang_comp == ProviderLangComparison.PLAIN:
             return a == b
 
-        # Split lang code to separate possible country/script code
-        a_codes = a.split("-")
-        b_codes = b.split("-")
-
-        if a_codes[0] == b_codes[0]:  # Check base codes
-            return True
-
-        return False
+        # Compare base codes, ignoring possible country/script codes
+        return self.languages.parts(a).base == self.languages.parts(b).base
 
     def dest_langs_for(self, code: str) -> list[str]:
         """
@@ -287,6 +542,41 @@ class BaseProvider:
         """
         return {}
 
+    @functools.cached_property
+    def _aliases(self) -> dict[str, str]:
+        return {**LANG_ALIASES, **self.lang_aliases}
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Circuit breaker shared by the instances of the provider using the same instance url."""
+        return CircuitBreaker.get(f"{self.name}:{self.instance_url}")
+
+    def supports_pair(self, src: str, dest: str) -> bool:
+        """
+        Check if the provider can translate between two normalized lang codes.
+
+        Args:
+            src: Source lang code, can be ``auto``.
+            dest: Destination lang code.
+        """
+        src_supported = self.supports_detection if src == "auto" else src in self.src_languages
+        return src_supported and dest in self.dest_languages
+
+    @property
+    def src_languages(self) -> LanguageSet:
+        """Source languages available for translating"""
+        return self.languages.src
+
+    @property
+    def dest_languages(self) -> LanguageSet:
+        """Destination languages available for translating"""
+        return self.languages.dest
+
+    @property
+    def tts_languages(self) -> LanguageSet:
+        """Languages available for TTS"""
+        return self.languages.tts
+
     """
     Provider features helpers
     """
@@ -379,6 +669,116 @@ class BaseProvider:
         """Reset saved recent user destination langs"""
         self.recent_dest_langs = []
 
+    """
+    Provider state cache helpers
+    """
+
+    def dump_state(self) -> dict[str, Any]:
+        """
+        Get the state populated by ``BaseProvider.init_trans`` and ``BaseProvider.init_tts``.
+
+        Returns:
+            A JSON serializable dict, to be loaded with ``BaseProvider.load_state``.
+        """
+        return {
+            "version": STATE_VERSION,
+            "src_languages": list(self.languages.src),
+            "dest_languages": list(self.languages.dest),
+            "tts_languages": list(self.languages.tts),
+            "nonstandard_langs": dict(self.languages.nonstandard),
+            "languages_names": dict(self.languages.names),
+            "chars_limit": self.chars_limit,
+            "features": self.features.value,
+        }
+
+    def load_state(self, state: dict[str, Any]) -> None:
+        """
+        Restore a state dumped with ``BaseProvider.dump_state``.
+
+        Args:
+            state: The provider state.
+        """
+        languages = LanguageRegistry()
+        languages.src = LanguageSet(state["src_languages"])
+        languages.dest = LanguageSet(state["dest_languages"])
+        languages.tts = LanguageSet(state["tts_languages"])
+        languages.nonstandard = dict(state["nonstandard_langs"])
+        languages.names = dict(state["languages_names"])
+        self.languages = languages
+        self.chars_limit = state["chars_limit"]
+        self.features = ProviderFeature(state["features"])
+
+    def _state_key(self, scope: Literal["trans", "tts"]) -> str:
+        return f"{scope}:{self.name}:{self.instance_url}"
+
+    async def restore_state(self, scope: Literal["trans", "tts"]) -> float | None:
+        """
+        Restore the provider state saved for the current instance.
+
+        This allows skipping ``BaseProvider.init_trans`` or ``BaseProvider.init_tts`` on startup.
+
+        Args:
+            scope: The init the state comes from.
+
+        Returns:
+            The age of the restored state in seconds, or None if there wasn't a valid one.
+        """
+        stored = await DiskCache.get().lookup_state(self._state_key(scope))
+        if stored is None:
+            return None
+
+        value, age = stored
+        try:
+            state = json.loads(value)
+            if state.get("version") != STATE_VERSION:
+                return None
+            self.load_state(state)
+        except (ValueError, TypeError, KeyError) as exc:
+            logging.warning(f"Ignoring invalid {self.name} provider state: {exc}")
+            return None
+
+        return age
+
+    def save_state(self, scope: Literal["trans", "tts"]) -> None:
+        """
+        Save the provider state for the current instance.
+
+        Args:
+            scope: The init the state comes from.
+        """
+        DiskCache.get().store_state(self._state_key(scope), json.dumps(self.dump_state()))
+
+    async def revalidate_state(self, scope: Literal["trans", "tts"]) -> bool:
+        """
+        Refresh a restored state running the provider init again.
+
+        The init runs on this instance, so anything else it sets up is refreshed too, but its languages
+        are added to a scratch registry, swapped in once it succeeds, so the restored ones stay usable
+        meanwhile.
+
+        Args:
+            scope: The init to run.
+
+        Returns:
+            If the state changed.
+        """
+        scratch = LanguageRegistry()
+        self._scratch_languages = scratch
+        try:
+            if scope == "trans":
+                await self.init_trans()
+            else:
+                await self.init_tts()
+        finally:
+            self._scratch_languages = None
+
+        previous = self.dump_state()
+        self.languages = scratch
+        changed = self.dump_state() != previous
+        self.save_state(scope)
+
+        return changed
+
     """
     General provider helpers
     """
@@ -433,6 +833,10 @@ class BaseProvider:
         Returns:
             The normalize language code.
         """
+        if (normalized := self.languages.get_normalized(code)) is not None:
+            return normalized
+
+        original_code = code
         code = code.replace("_", "-").lower()  # Normalize separator
         codes = code.split("-")
 
@@ -445,9 +849,8 @@ class BaseProvider:
 
             code = "-".join(codes)
 
-        aliases = {**LANG_ALIASES, **self.lang_aliases}
-        if code in aliases:
-            code = aliases[code]
+        code = self._aliases.get(code, code)
+        self.languages.set_normalized(original_code, code)
 
         return code
 
@@ -474,21 +877,23 @@ class BaseProvider:
         """
 
         code = self.normalize_lang_code(original_code)  # Get normalized lang code
+        # The registry being populated by ``BaseProvider.revalidate_state``, if any
+        languages = self.languages if self._scratch_languages is None else self._scratch_languages
 
         if trans_src:  # Add lang to supported languages list
-            self.src_languages.append(code)
+            languages.src.add(code)
         if trans_dest:
-            self.dest_languages.append(code)
+            languages.dest.add(code)
         if tts:  # Add lang to supported TTS languages list
-            self.tts_languages.append(code)
+            languages.tts.add(code)
 
-        if code != original_code and code not in self._nonstandard_langs:
+        if code != original_code and code not in languages.nonstandard:
             # Save a divergent lang code for later denormalization
-            self._nonstandard_langs[code] = original_code
+            languages.nonstandard[code] = original_code
 
-        if name is not None and code not in self._languages_names:
+        if name is not None and code not in languages.names:
             # Save name provided by the service
-            self._languages_names[code] = name
+            languages.names[code] = name
 
     def denormalize_lang(self, *codes: str) -> tuple[str, ...]:
         """
@@ -501,10 +906,7 @@ class BaseProvider:
             The same amount of given codes but denormalized.
         """
 
-        result = []
-        for code in codes:
-            result.append(self._nonstandard_langs.get(code, code))
-        return tuple(result)
+        return tuple(self.languages.denormalize(code) for code in codes)
 
     def get_lang_name(self, code: str) -> str | None:
         """
@@ -522,6 +924,6 @@ class BaseProvider:
         name = get_lang_name(code)  # Try getting translated name from Dialect
 
         if name is None:  # Get name from provider if available
-            return self._languages_names.get(code, code)
+            return self.languages.names.get(code, code)
 
         return name
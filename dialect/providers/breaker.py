@@ -0,0 +1,183 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from enum import Enum, auto
+
+from dialect.providers.errors import CircuitOpen
+
+
+class CircuitState(Enum):
+    CLOSED = auto()
+    """ Requests are sent normally """
+    OPEN = auto()
+    """ Requests fail right away """
+    HALF_OPEN = auto()
+    """ A probe request is allowed to check if the provider recovered """
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of a provider to stop sending it requests while it's failing.
+
+    The circuit opens when the failure rate of the latest calls reaches a threshold, counting calls
+    slower than ``slow_call`` as failures. After ``open_duration`` a single probe call is allowed,
+    closing the circuit if it succeeds.
+
+    Calls are single network attempts, see ``SoupProvider.send_and_read_and_process``, so time spent
+    waiting for client-side rate limits or between retries doesn't count against the provider.
+    """
+
+    instances: dict[str, CircuitBreaker] = {}
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call: float = 10.0,
+        open_duration: float = 30.0,
+    ):
+        self.name = name
+        """ Name of the circuit """
+        self.window = window
+        """ Number of latest calls considered """
+        self.min_calls = min_calls
+        """ Min number of calls in the window before the circuit can open """
+        self.failure_rate = failure_rate
+        """ Rate of failed calls that opens the circuit """
+        self.slow_call = slow_call
+        """ Seconds after which a successful call is considered failed """
+        self.open_duration = open_duration
+        """ Seconds the circuit stays open before allowing a probe """
+
+        self.opened = 0
+        """ Number of times the circuit opened """
+        self.rejected = 0
+        """ Number of calls rejected while open """
+
+        self.latencies: deque[float] = deque(maxlen=100)
+        """ Durations in seconds of the latest successful calls """
+
+        self._calls: deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+
+    @staticmethod
+    def get(name: str) -> CircuitBreaker:
+        """Return the active CircuitBreaker with the given name."""
+        if name not in CircuitBreaker.instances:
+            CircuitBreaker.instances[name] = CircuitBreaker(name)
+        return CircuitBreaker.instances[name]
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def allows_requests(self) -> bool:
+        """If a call would be allowed now."""
+        state = self.state
+        return state == CircuitState.CLOSED or (state == CircuitState.HALF_OPEN and not self._probing)
+
+    def record(self, success: bool, duration: float = 0.0) -> None:
+        """
+        Account the result of a call, see ``CircuitBreaker.check``.
+
+        Args:
+            success: If the call succeeded.
+            duration: Seconds the call took.
+        """
+        if success:
+            self.latencies.append(duration)
+
+        success = success and duration < self.slow_call
+
+        if self._state == CircuitState.HALF_OPEN:
+            if success:
+                self._close()
+            else:
+                self._open()
+            return
+
+        self._calls.append(success)
+        failures = self._calls.count(False)
+        if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate:
+            self._open()
+
+    def check(self) -> bool:
+        """
+        Check if a call can be sent now.
+
+        The call must then be accounted with ``CircuitBreaker.record``, or ``CircuitBreaker.discard``
+        if its outcome says nothing about the provider health, like a cancelled call.
+
+        Returns:
+            If the call is the probe of a half open circuit.
+
+        Raises:
+            CircuitOpen: If the circuit doesn't allow requests.
+        """
+        if not self.allows_requests:
+            self.rejected += 1
+            raise CircuitOpen(f"{self.name} is failing, not sending requests for now")
+
+        self._probing = self.state == CircuitState.HALF_OPEN
+        return self._probing
+
+    def discard(self, probe: bool) -> None:
+        """
+        Forget a checked call without accounting it.
+
+        Args:
+            probe: If the call was the probe, as returned by ``CircuitBreaker.check``.
+        """
+        if probe:
+            self._probing = False
+
+    def latency_percentile(self, percentile: float, min_samples: int = 10) -> float | None:
+        """
+        Get a percentile of the latest successful calls durations.
+
+        Args:
+            percentile: The percentile, from 0 to 100.
+            min_samples: Min number of calls needed to compute it.
+
+        Returns:
+            The duration in seconds or None if there aren't enough calls.
+        """
+        if len(self.latencies) < min_samples:
+            return None
+
+        latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        return latencies[index]
+
+    def _open(self) -> None:
+        if self._state != CircuitState.OPEN:
+            logging.warning(f"Circuit of {self.name} opened")
+            self.opened += 1
+
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        self._calls.clear()
+
+    def _close(self) -> None:
+        logging.info(f"Circuit of {self.name} closed")
+        self._state = CircuitState.CLOSED
+        self._probing = False
+        self._calls.clear()
+
+    def stats(self) -> dict[str, int | str]:
+        """Get the circuit counters."""
+        return {"state": self.state.name, "opened": self.opened, "rejected": self.rejected}
@@ -0,0 +1,498 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from gi.repository import GLib
+
+if TYPE_CHECKING:
+    from dialect.providers.base import BaseProvider, Translation, TranslationRequest
+
+_T = TypeVar("_T")
+
+MEMORY_CACHE_SIZE = 512
+""" Max number of translations kept in memory """
+DISK_CACHE_SIZE = 16 * 1024 * 1024
+""" Max size in bytes of the translations stored on disk """
+DISK_CACHE_TTL = 7 * 24 * 60 * 60
+""" Seconds a translation stored on disk is considered valid """
+STATE_TTL = 24 * 60 * 60
+""" Seconds a stored provider state is used without revalidating it """
+STATE_VERSION = 1
+""" Version of the stored provider states format """
+HTTP_CACHE_SIZE = 4 * 1024 * 1024
+""" Max size in bytes of the HTTP responses stored on disk """
+HTTP_CACHE_FRESHNESS = 60 * 60
+""" Seconds a stored HTTP response is used without revalidating it """
+EVICTION_INTERVAL = 64
+""" Number of translations stored on disk between removals of the expired and least recently used ones """
+
+
+def text_fingerprint(text: str) -> str:
+    """
+    Get a stable fingerprint of a text to translate.
+
+    The text is NFC normalized, so texts that only differ in unicode composition share
+    the same fingerprint. Whitespace is kept as providers preserve it in translations.
+
+    Args:
+        text: Text to fingerprint.
+
+    Returns:
+        The hex digest of the normalized text.
+    """
+    normalized = unicodedata.normalize("NFC", text)
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def serialize_translation(translation: Translation) -> str:
+    """Dump a translation to JSON, without its original request."""
+    data = dataclasses.asdict(translation)
+    del data["original"]
+    return json.dumps(data, separators=(",", ":"))
+
+
+def deserialize_translation(value: str, request: TranslationRequest) -> Translation:
+    """Load a translation dumped with ``serialize_translation``."""
+    from dialect.providers.base import Translation, TranslationMistake, TranslationPronunciation
+
+    data = json.loads(value)
+    mistakes = data.get("mistakes")
+    pronunciation = data.get("pronunciation") or {"src": None, "dest": None}
+
+    return Translation(
+        data["text"],
+        request,
+        data.get("detected"),
+        TranslationMistake(**mistakes) if mistakes else None,
+        TranslationPronunciation(**pronunciation),
+    )
+
+
+@dataclasses.dataclass
+class CachedResponse:
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    age: float
+
+
+class DiskCache:
+    """
+    SQLite backed translations cache.
+
+    The database is opened in WAL mode so the app, the search provider and any other
+    process can read and write it at the same time.
+
+    Database operations run in order on a dedicated thread, so the main loop never waits on
+    the disk or on the database lock held by another process. Writes are queued without
+    waiting for them, lookups are awaited.
+    """
+
+    instance = None
+
+    def __init__(self, path: str, max_size: int = DISK_CACHE_SIZE, ttl: int = DISK_CACHE_TTL):
+        self.path = path
+        """ Path of the database file """
+        self.max_size = max_size
+        """ Max size in bytes of the stored values before evicting the least recently used """
+        self.ttl = ttl
+        """ Seconds an entry is considered valid """
+
+        self._conn: sqlite3.Connection | None = None
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._writes = 0
+
+    @staticmethod
+    def get() -> DiskCache:
+        """Return an active instance of DiskCache."""
+        if DiskCache.instance is None:
+            path = os.path.join(GLib.get_user_cache_dir(), "dialect", "cache.sqlite")
+            DiskCache.instance = DiskCache(path)
+        return DiskCache.instance
+
+    @property
+    def pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Single thread executor running the database operations, created on first use."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="dialect-cache")
+        return self._pool
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Database connection, created on first use, only to be used from ``DiskCache.pool``."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS translations_accessed ON translations (accessed)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS provider_states ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, size INTEGER NOT NULL, "
+                "stored REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn = conn
+
+        return self._conn
+
+    async def lookup(self, key: str) -> str | None:
+        """
+        Get a stored value.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            The value or None if missing or expired.
+        """
+        return await self._run(self._lookup, key)
+
+    def store(self, key: str, value: str) -> None:
+        """
+        Save a value, removing expired and least recently used entries if needed.
+
+        Entries are removed every ``EVICTION_INTERVAL`` writes, as summing the stored sizes takes
+        a whole table scan, so the size limit can be exceeded by that many values for a while.
+
+        Args:
+            key: Key of the value.
+            value: Value to save.
+        """
+        self._queue(self._store, key, value)
+
+    async def lookup_state(self, key: str) -> tuple[str, float] | None:
+        """
+        Get a stored provider state.
+
+        Args:
+            key: Key of the state.
+
+        Returns:
+            The state and its age in seconds, or None if missing.
+        """
+        return await self._run(self._lookup_state, key)
+
+    def store_state(self, key: str, value: str) -> None:
+        """
+        Save a provider state.
+
+        Args:
+            key: Key of the state.
+            value: State to save.
+        """
+        self._queue(self._store_state, key, value)
+
+    async def lookup_response(self, key: str) -> CachedResponse | None:
+        """
+        Get a stored HTTP response.
+
+        Args:
+            key: Key of the response.
+
+        Returns:
+            The response or None if missing.
+        """
+        return await self._run(self._lookup_response, key)
+
+    def store_response(self, key: str, body: bytes, etag: str | None, last_modified: str | None) -> None:
+        """
+        Save an HTTP response, removing the least recently used ones if needed.
+
+        Args:
+            key: Key of the response.
+            body: Response body.
+            etag: Value of the ETag header.
+            last_modified: Value of the Last-Modified header.
+        """
+        self._queue(self._store_response, key, body, etag, last_modified)
+
+    def refresh_response(self, key: str) -> None:
+        """
+        Mark a stored HTTP response as revalidated.
+
+        Args:
+            key: Key of the response.
+        """
+        self._queue(self._refresh_response, key)
+
+    def clear(self) -> None:
+        """Remove all the stored translations and HTTP responses."""
+        self._queue(self._clear)
+
+    def shutdown(self) -> None:
+        """Write the queued changes and close the database."""
+        if self._pool is not None:
+            self._pool.submit(self._close)
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    async def _run(self, func: Callable[..., _T], *args: Any) -> _T:
+        return await asyncio.wrap_future(self.pool.submit(func, *args))
+
+    def _queue(self, func: Callable[..., Any], *args: Any) -> None:
+        self.pool.submit(func, *args)
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _lookup(self, key: str) -> str | None:
+        now = time.time()
+
+        try:
+            row = self.conn.execute(
+                "SELECT value FROM translations WHERE key = ? AND created > ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.conn.execute("UPDATE translations SET accessed = ? WHERE key = ?", (now, key))
+            return row[0]
+        except sqlite3.Error as exc:
+            logging.warning(f"Translations disk cache lookup failed: {exc}")
+            return None
+
+    def _store(self, key: str, value: str) -> None:
+        now = time.time()
+
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)", (key, value, len(value), now, now)
+                )
+
+                self._writes += 1
+                if self._writes % EVICTION_INTERVAL != 1:
+                    return
+
+                self.conn.execute("DELETE FROM translations WHERE created <= ?", (now - self.ttl,))
+
+                (size,) = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM translations").fetchone()
+                if size > self.max_size:
+                    # Drop the least recently used rows until we are under the size limit
+                    self.conn.execute(
+                        "DELETE FROM translations WHERE key IN ("
+                        "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC) AS total "
+                        "FROM translations) WHERE total > ?)",
+                        (self.max_size,),
+                    )
+        except sqlite3.Error as exc:
+            logging.warning(f"Translations disk cache store failed: {exc}")
+
+    def _lookup_state(self, key: str) -> tuple[str, float] | None:
+        try:
+            row = self.conn.execute("SELECT value, updated FROM provider_states WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            return row[0], time.time() - row[1]
+        except sqlite3.Error as exc:
+            logging.warning(f"Provider states cache lookup failed: {exc}")
+            return None
+
+    def _store_state(self, key: str, value: str) -> None:
+        try:
+            self.conn.execute("INSERT OR REPLACE INTO provider_states VALUES (?, ?, ?)", (key, value, time.time()))
+        except sqlite3.Error as exc:
+            logging.warning(f"Provider states cache store failed: {exc}")
+
+    def _lookup_response(self, key: str) -> CachedResponse | None:
+        now = time.time()
+
+        try:
+            row = self.conn.execute(
+                "SELECT body, etag, last_modified, stored FROM http_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.conn.execute("UPDATE http_responses SET accessed = ? WHERE key = ?", (now, key))
+            return CachedResponse(row[0], row[1], row[2], now - row[3])
+        except sqlite3.Error as exc:
+            logging.warning(f"HTTP disk cache lookup failed: {exc}")
+            return None
+
+    def _store_response(self, key: str, body: bytes, etag: str | None, last_modified: str | None) -> None:
+        now = time.time()
+
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO http_responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, body, etag, last_modified, len(body), now, now),
+                )
+                self.conn.execute(
+                    "DELETE FROM http_responses WHERE key IN ("
+                    "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC) AS total "
+                    "FROM http_responses) WHERE total > ?)",
+                    (HTTP_CACHE_SIZE,),
+                )
+        except sqlite3.Error as exc:
+            logging.warning(f"HTTP disk cache store failed: {exc}")
+
+    def _refresh_response(self, key: str) -> None:
+        try:
+            self.conn.execute("UPDATE http_responses SET stored = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as exc:
+            logging.warning(f"HTTP disk cache refresh failed: {exc}")
+
+    def _clear(self) -> None:
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.execute("DELETE FROM translations")
+                self.conn.execute("DELETE FROM http_responses")
+        except sqlite3.Error as exc:
+            logging.warning(f"Translations disk cache clear failed: {exc}")
+
+
+class TranslationCache:
+    """
+    Process-wide LRU cache of translations.
+
+    Entries are keyed by provider name and instance, normalized lang codes and a text fingerprint.
+    Memory misses fall back to the shared ``DiskCache``, unless it's disabled with ``persistent``.
+    """
+
+    instance = None
+
+    def __init__(self, max_size: int = MEMORY_CACHE_SIZE):
+        self.max_size = max_size
+        """ Max number of entries before evicting the least recently used """
+        self._entries: OrderedDict[str, Translation] = OrderedDict()
+
+        self.disk = DiskCache.get()
+        """ Persistent cache shared with other Dialect processes """
+        self.persistent = True
+        """ If translations are saved to and looked up on disk """
+
+        self.hits = 0
+        """ Number of lookups served from memory """
+        self.disk_hits = 0
+        """ Number of lookups served from disk """
+        self.misses = 0
+        """ Number of lookups not found in cache """
+        self.evictions = 0
+        """ Number of entries evicted because of the size limit """
+
+    @staticmethod
+    def get() -> TranslationCache:
+        """Return an active instance of TranslationCache."""
+        if TranslationCache.instance is None:
+            TranslationCache.instance = TranslationCache()
+        return TranslationCache.instance
+
+    @staticmethod
+    def make_key(provider: BaseProvider, request: TranslationRequest) -> str:
+        """
+        Build the cache key of a request for a provider.
+
+        Translations from different instances of a provider, or with different API keys,
+        as keys can select the service plan, don't share entries.
+
+        Args:
+            provider: Provider doing the translation.
+            request: The translation request.
+
+        Returns:
+            The cache key.
+        """
+        src = provider.normalize_lang_code(request.src)
+        dest = provider.normalize_lang_code(request.dest)
+        account = ""
+        if provider.supports_api_key and provider.api_key:
+            account = hashlib.blake2b(provider.api_key.encode("utf-8"), digest_size=8).hexdigest()
+        return f"{provider.name}:{provider.instance_url}:{account}:{src}:{dest}:{text_fingerprint(request.text)}"
+
+    async def lookup(self, key: str, request: TranslationRequest) -> Translation | None:
+        """
+        Get a cached translation.
+
+        Args:
+            key: Key built with ``TranslationCache.make_key``.
+            request: Request to attach as the original of the returned translation.
+
+        Returns:
+            A copy of the cached translation or None.
+        """
+        translation = self._entries.get(key)
+
+        if translation is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return dataclasses.replace(translation, original=request)
+
+        if self.persistent and (value := await self.disk.lookup(key)) is not None:
+            try:
+                translation = deserialize_translation(value, request)
+            except (ValueError, TypeError, KeyError) as exc:
+                logging.warning(f"Ignoring invalid cached translation: {exc}")
+            else:
+                self.disk_hits += 1
+                self._store_memory(key, translation)
+                return translation
+
+        self.misses += 1
+        return None
+
+    def store(self, key: str, translation: Translation) -> None:
+        """
+        Save a translation, evicting the least recently used entries if needed.
+
+        Args:
+            key: Key built with ``TranslationCache.make_key``.
+            translation: Translation to save.
+        """
+        self._store_memory(key, translation)
+        if self.persistent:
+            self.disk.store(key, serialize_translation(translation))
+
+    def _store_memory(self, key: str, translation: Translation) -> None:
+        self._entries[key] = translation
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all the cached translations, including the ones on disk."""
+        self._entries.clear()
+        self.disk.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
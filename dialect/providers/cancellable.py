@@ -0,0 +1,104 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterable, Iterator, TypeVar
+
+from gi.repository import Gio, GObject
+
+from dialect.providers.errors import RequestCancelled
+
+_T = TypeVar("_T")
+
+
+@contextmanager
+def on_cancelled(cancellable: Gio.Cancellable | None, callback: Callable[[], None]) -> Iterator[None]:
+    """
+    Call callback if cancellable gets cancelled while the context is active.
+
+    The callback is called right away if the cancellable is already cancelled.
+    """
+    if cancellable is None:
+        yield
+        return
+
+    # Gio.Cancellable.connect() and disconnect() shadow the GObject signals ones
+    handler = GObject.Object.connect(cancellable, "cancelled", lambda _cancellable: callback())
+    try:
+        if cancellable.is_cancelled():
+            callback()
+        yield
+    finally:
+        GObject.Object.disconnect(cancellable, handler)
+
+
+async def await_cancellable(awaitable: Awaitable[_T], cancellable: Gio.Cancellable | None) -> _T:
+    """
+    Await an awaitable unless cancellable gets cancelled first.
+
+    The awaitable is cancelled then, wrap it with ``asyncio.shield`` to let it run.
+
+    Args:
+        awaitable: The awaitable.
+        cancellable: Cancellable to stop awaiting.
+
+    Returns:
+        The result of the awaitable.
+
+    Raises:
+        RequestCancelled: If the cancellable is cancelled first.
+    """
+    future = asyncio.ensure_future(awaitable)
+    if cancellable is None:
+        return await future
+
+    cancelled = asyncio.get_running_loop().create_future()
+
+    def cancel():
+        if not cancelled.done():
+            cancelled.set_result(None)
+
+    with on_cancelled(cancellable, cancel):
+        try:
+            await asyncio.wait({future, cancelled}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            future.cancel()
+            raise
+
+    if not future.done():
+        future.cancel()
+        raise RequestCancelled("Request was cancelled")
+
+    return future.result()
+
+
+async def gather_or_cancel(
+    funcs: Iterable[Callable[[Gio.Cancellable], Awaitable[_T]]], cancellable: Gio.Cancellable | None = None
+) -> list[_T]:
+    """
+    Run several calls concurrently, like ``asyncio.gather``, but stop the others as soon as one raises.
+
+    Each call receives a cancellable shared by all of them and linked to ``cancellable``, it gets
+    cancelled together with their tasks when one of them raises.
+
+    Args:
+        funcs: The calls, taking the shared cancellable.
+        cancellable: Cancellable to abort all the calls.
+
+    Returns:
+        The results, in the same order as ``funcs``.
+    """
+    linked = Gio.Cancellable()
+    with on_cancelled(cancellable, linked.cancel):
+        tasks = [asyncio.ensure_future(func(linked)) for func in funcs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            linked.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -2,6 +2,18 @@ class RequestError(Exception):
     """Exception raised when request fails."""
 
 
+class RequestCancelled(RequestError):
+    """Exception raised when request is cancelled."""
+
+
+class ResponseTooLarge(RequestError):
+    """Exception raised when a response body exceeds the max size allowed."""
+
+
+class CircuitOpen(RequestError):
+    """Exception raised when requests to a failing provider are paused."""
+
+
 class ProviderError(Exception):
     """Exception raised when provider fails."""
 
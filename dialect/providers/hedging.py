@@ -0,0 +1,123 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import ExitStack
+
+from gi.repository import Gio
+
+from dialect.providers.base import BaseProvider, Translation, TranslationRequest
+from dialect.providers.cancellable import on_cancelled
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Retrieve the result of a dropped task so its errors aren't reported as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class Hedger:
+    """
+    Races slow translations against a secondary provider.
+
+    If the primary provider hasn't answered within a percentile of its observed latency, the same
+    request is sent to the secondary provider. The first successful answer wins and the other request
+    is cancelled.
+    """
+
+    instance = None
+
+    def __init__(self):
+        self.requests = 0
+        """ Number of hedgeable translations """
+        self.fired = 0
+        """ Number of translations sent to the secondary provider """
+        self.won = 0
+        """ Number of translations the secondary provider answered first """
+
+    @staticmethod
+    def get() -> Hedger:
+        """Return an active instance of Hedger."""
+        if Hedger.instance is None:
+            Hedger.instance = Hedger()
+        return Hedger.instance
+
+    async def translate(
+        self,
+        primary: BaseProvider,
+        secondary: BaseProvider,
+        request: TranslationRequest,
+        percentile: float,
+        cancellable: Gio.Cancellable | None = None,
+    ) -> Translation:
+        """
+        Translate a request, hedging it with a secondary provider if the primary one is slow.
+
+        Args:
+            primary: The preferred provider.
+            secondary: The provider to hedge with, it must support the request lang pair.
+            request: The translation request.
+            percentile: Percentile of the primary provider latency to wait before hedging.
+            cancellable: Cancellable to abort both translations.
+
+        Returns:
+            The first successful translation.
+        """
+        delay = primary.circuit_breaker.latency_percentile(percentile)
+        if delay is None:
+            # Not enough data to know what slow means
+            return await primary.translate(request, cancellable)
+
+        self.requests += 1
+
+        with ExitStack() as links:
+
+            def start(provider: BaseProvider) -> tuple[asyncio.Task, Gio.Cancellable]:
+                # Cancelled with the parent cancellable
+                child = Gio.Cancellable()
+                links.enter_context(on_cancelled(cancellable, child.cancel))
+                return asyncio.ensure_future(provider.translate(request, child)), child
+
+            primary_task, primary_cancellable = start(primary)
+
+            done, _pending = await asyncio.wait({primary_task}, timeout=delay)
+            if done:
+                return primary_task.result()
+
+            self.fired += 1
+            logging.debug(f"Hedging slow {primary.name} translation with {secondary.name}")
+
+            secondary_task, secondary_cancellable = start(secondary)
+            contenders = {primary_task: primary_cancellable, secondary_task: secondary_cancellable}
+            pending = set(contenders)
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+
+                    # Cancel the loser
+                    for other, other_cancellable in contenders.items():
+                        if other is not task:
+                            other_cancellable.cancel()
+                            other.add_done_callback(_consume_result)
+
+                    winner = secondary if task is secondary_task else primary
+                    if winner is secondary:
+                        self.won += 1
+
+                    logging.debug(f"Hedged translation won by {winner.name}, {self.stats()}")
+
+                    return task.result()
+
+            # Both failed, report the primary error
+            return primary_task.result()
+
+    def stats(self) -> dict[str, int]:
+        """Get the hedging counters."""
+        return {"requests": self.requests, "fired": self.fired, "won": self.won}
@@ -0,0 +1,141 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass
+class HostStats:
+    """Observed health of a host."""
+
+    latency: float | None = None
+    """ Moving average of the successful requests durations in seconds """
+    error_rate: float = 0.0
+    """ Moving average of the failed requests, from 0 to 1 """
+    requests: int = 0
+    """ Number of requests reported """
+
+    @property
+    def score(self) -> float:
+        """Lower is better, hosts without data score best so they get measured."""
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + 4 * self.error_rate)
+
+
+class HostPool:
+    """
+    Picks the host to send requests to among interchangeable ones.
+
+    A small set of hosts is kept active and requests stick to the best scored one, so its connection
+    is reused. Hosts that fail or throttle are replaced by a random one and benched for a while.
+    """
+
+    instances: dict[str, HostPool] = {}
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        size: int = 3,
+        alpha: float = 0.3,
+        cooldown: float = 300.0,
+        switch_margin: float = 0.8,
+    ):
+        self.hosts = tuple(hosts)
+        """ All the hosts that can be used """
+        self.alpha = alpha
+        """ Weight of the latest request in the moving averages """
+        self.cooldown = cooldown
+        """ Seconds a replaced host isn't used """
+        self.switch_margin = switch_margin
+        """ Score ratio another active host must beat to replace the current one """
+
+        self.active = random.sample(self.hosts, min(size, len(self.hosts)))
+        """ Hosts requests can be sent to """
+        self.current: str | None = None
+        """ Host requests are sent to """
+        self.rotations = 0
+        """ Number of hosts replaced """
+
+        self._stats: dict[str, HostStats] = {}
+        self._benched: dict[str, float] = {}
+
+    @staticmethod
+    def get(name: str, hosts: Sequence[str]) -> HostPool:
+        """Return the active HostPool with the given name, creating it with hosts if needed."""
+        if name not in HostPool.instances:
+            HostPool.instances[name] = HostPool(hosts)
+        return HostPool.instances[name]
+
+    def stats_of(self, host: str) -> HostStats:
+        """Get the observed health of a host."""
+        if host not in self._stats:
+            self._stats[host] = HostStats()
+        return self._stats[host]
+
+    def pick(self) -> str:
+        """Get the host to send the next request to."""
+        best = min(self.active, key=lambda host: self.stats_of(host).score)
+
+        if (
+            self.current not in self.active
+            or self.stats_of(best).score < self.stats_of(self.current).score * self.switch_margin  # type: ignore
+        ):
+            self.current = best
+
+        return self.current  # type: ignore
+
+    def report(self, host: str, success: bool, duration: float = 0.0) -> None:
+        """
+        Account the result of a request, replacing the host if it failed.
+
+        Args:
+            host: Host the request was sent to.
+            success: If the request succeeded, throttled requests count as failed.
+            duration: Seconds the request took.
+        """
+        stats = self.stats_of(host)
+        stats.requests += 1
+        stats.error_rate += self.alpha * ((0.0 if success else 1.0) - stats.error_rate)
+
+        if success:
+            if stats.latency is None:
+                stats.latency = duration
+            else:
+                stats.latency += self.alpha * (duration - stats.latency)
+        elif host in self.active:
+            self._rotate(host)
+
+    def _rotate(self, host: str) -> None:
+        now = time.monotonic()
+        self._benched[host] = now
+
+        candidates = [
+            candidate
+            for candidate in self.hosts
+            if candidate not in self.active and now - self._benched.get(candidate, -self.cooldown) >= self.cooldown
+        ]
+        if not candidates:
+            return
+
+        replacement = random.choice(candidates)
+        self.active[self.active.index(host)] = replacement
+        self.rotations += 1
+
+        logging.debug(f"Replaced host {host} with {replacement}")
+
+    def stats(self) -> dict[str, float | int | str | None]:
+        """Get the pool counters."""
+        current = self.stats_of(self.current) if self.current else HostStats()
+        return {
+            "current": self.current,
+            "latency": current.latency,
+            "error_rate": current.error_rate,
+            "rotations": self.rotations,
+        }
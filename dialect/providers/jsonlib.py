@@ -0,0 +1,106 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+""" Name of the JSON library in use """
+
+JSONDecodeError = json.JSONDecodeError
+""" Raised by ``loads`` for invalid documents, orjson errors subclass it too """
+
+_FRAME_LENGTH_RE = re.compile(rb"\s*(\d+)\n")
+_FRAME_LENGTH_TEXT_RE = re.compile(r"\s*\d+\s*")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Deserialize a JSON document.
+
+    orjson parses buffers like memoryviews without copying them, the stdlib needs a bytes copy.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The document deserialized to a python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON, with non-ASCII characters escaped like ``json.dumps`` does.
+
+    orjson can't escape them, so its output is only used when it's ASCII.
+
+    Args:
+        data: Data to serialize, anything json.dumps can handle.
+
+    Returns:
+        The JSON document bytes.
+    """
+    if orjson is not None:
+        document = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        if document.isascii():
+            return document
+
+    return json.dumps(data, separators=(",", ":")).encode("ascii")
+
+
+def loads_frames(data: bytes | bytearray, guard: bytes = b"") -> list[Any]:
+    """
+    Deserialize a stream of JSON documents, each one preceded by a line with its length.
+
+    Frames are sliced by their length and parsed straight from the data bytes.
+
+    Lengths count UTF-16 code units in Google's batchexecute responses, so the slice of a frame with
+    non-ASCII text is short and fails to parse. The rest of the data is then decoded and parsed with
+    ``json.JSONDecoder.raw_decode``.
+
+    Args:
+        data: The frames.
+        guard: Anti-XSSI prefix skipped if the data starts with it.
+
+    Returns:
+        The deserialized frames.
+    """
+    view = memoryview(data)
+    position = len(guard) if guard and data.startswith(guard) else 0
+    frames: list[Any] = []
+
+    while (match := _FRAME_LENGTH_RE.match(data, position)) is not None:
+        # The length counts the newline before the frame, be lenient if it doesn't
+        end = match.end() - 1 + int(match.group(1))
+        if data[end : end + 1] == b"]":
+            end += 1
+
+        try:
+            frame = loads(view[match.end() : end])
+        except ValueError:
+            # Invalid JSON, or a UTF-8 sequence cut by the slice, which the stdlib reports as UnicodeDecodeError
+            break
+
+        frames.append(frame)
+        position = end
+
+    text = data[position:].decode("utf-8")
+    decoder = json.JSONDecoder()
+    index = 0
+    while (match := _FRAME_LENGTH_TEXT_RE.match(text, index)) is not None:
+        frame, index = decoder.raw_decode(text, match.end())
+        frames.append(frame)
+
+    return frames
@@ -2,28 +2,139 @@
 # Copyright 2023 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 import asyncio
 import concurrent.futures
+import time
 from typing import Callable, TypeVar
 
 from dialect.providers.base import BaseProvider
 
+_T = TypeVar("_T")
+
+THREAD_WORKERS = 4
+""" Default max number of threads of the shared executor """
+
+
+def _timed_call(worker: Callable[..., _T], *args) -> tuple[float, _T]:
+    """Run worker returning the time it started at, so the time it waited in queue can be known."""
+    return time.time(), worker(*args)
+
+
+class LocalExecutor:
+    """
+    Process-wide bounded thread executor for local provider work.
+
+    Jobs beyond the max number of workers wait in queue, queue depth and wait times are tracked.
+    """
+
+    instance = None
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        """ Max number of jobs running at the same time """
+
+        self.submitted = 0
+        """ Number of jobs submitted """
+        self.queued = 0
+        """ Number of unfinished jobs, running or waiting for a free worker """
+        self.max_queued = 0
+        """ Max number of unfinished jobs at the same time """
+        self.wait_time = 0.0
+        """ Total seconds jobs waited for a free worker """
+        self.max_wait_time = 0.0
+        """ Max seconds a job waited for a free worker """
+
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+
+    @staticmethod
+    def get() -> LocalExecutor:
+        """Return the active instance of LocalExecutor."""
+        if LocalExecutor.instance is None:
+            LocalExecutor.instance = LocalExecutor(THREAD_WORKERS)
+        return LocalExecutor.instance
+
+    @staticmethod
+    def configure(threads: int) -> None:
+        """
+        Set the max number of threads of the shared executor.
+
+        The active executor is shut down, its queued jobs are cancelled.
+
+        Args:
+            threads: Max number of threads.
+        """
+        LocalExecutor.shutdown_all()
+        LocalExecutor.instance = LocalExecutor(threads)
+
+    @staticmethod
+    def shutdown_all() -> None:
+        """Shut down the shared executor, cancelling queued jobs."""
+        if LocalExecutor.instance is not None:
+            LocalExecutor.instance.shutdown()
+        LocalExecutor.instance = None
+
+    @property
+    def pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Executor pool, created on first use."""
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(self.max_workers, thread_name_prefix="dialect-local")
+        return self._pool
+
+    async def run(self, worker: Callable[..., _T], *args) -> _T:
+        """
+        Run worker in the executor.
+
+        Args:
+            worker: Function to execute on a thread.
+            *args: Args for the worker function.
+        """
+        loop = asyncio.get_running_loop()
+
+        self.submitted += 1
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        submitted_at = time.time()
+
+        try:
+            started_at, result = await loop.run_in_executor(self.pool, _timed_call, worker, *args)
+        finally:
+            self.queued -= 1
+
+        waited = max(started_at - submitted_at, 0.0)
+        self.wait_time += waited
+        self.max_wait_time = max(self.max_wait_time, waited)
+
+        return result
+
+    def shutdown(self) -> None:
+        """Shut down the executor without waiting, cancelling queued jobs."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the executor counters."""
+        return {
+            "max_workers": self.max_workers,
+            "submitted": self.submitted,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
 
 class LocalProvider(BaseProvider):
     """Base class for providers needing local threaded helpers"""
 
-    _T = TypeVar("_T")
-
     async def run_async(self, worker: Callable[..., _T], *args) -> _T:
         """
-        Runs worker in a ThreadPoolExecutor.
+        Runs worker in the shared thread executor.
 
         Args:
             worker: Function to execute on the thread.
             *args: Args for the worker function.
         """
-
-        loop = asyncio.get_running_loop()
-
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            return await loop.run_in_executor(pool, worker, *args)
+        return await LocalExecutor.get().run(worker, *args)
@@ -0,0 +1,130 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import importlib
+import importlib.util
+import logging
+
+from dialect.providers.base import BaseProvider, ProviderCapability, ProviderFeature
+
+
+class ProviderEntry:
+    """
+    Static description of a provider module.
+
+    It allows listing providers and checking their capabilities without importing their modules,
+    which happens on first instantiation.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        name: str,
+        prettyname: str,
+        capabilities: ProviderCapability,
+        features: ProviderFeature = ProviderFeature.NONE,
+        requires: tuple[str, ...] = (),
+    ):
+        self.module = module
+        """ Module name inside ``dialect.providers.modules`` """
+        self.name = name
+        """ Provider name, must match ``BaseProvider.name`` """
+        self.prettyname = prettyname
+        """ Provider name shown in the UI """
+        self.capabilities = capabilities
+        """ Provider capabilities, must match ``BaseProvider.capabilities`` """
+        self.features = features
+        """ Provider features, must match ``BaseProvider.features`` """
+        self.requires = requires
+        """ Third party modules the provider module imports """
+
+        self._class: type[BaseProvider] | None = None
+
+    def __call__(self) -> BaseProvider:
+        """Create a new instance of the provider."""
+        return self.load()()
+
+    @property
+    def available(self) -> bool:
+        """If the provider dependencies are installed, checked without importing them."""
+        return all(importlib.util.find_spec(dep) is not None for dep in self.requires)
+
+    def load(self) -> type[BaseProvider]:
+        """Import the provider module and return its provider class."""
+        if self._class is None:
+            provider_class: type[BaseProvider] = importlib.import_module(
+                "dialect.providers.modules." + self.module
+            ).Provider
+
+            if (provider_class.name, provider_class.capabilities, provider_class.features) != (
+                self.name,
+                self.capabilities,
+                self.features,
+            ):
+                logging.warning(f"The {self.name} provider manifest entry is out of sync with its module")
+
+            self._class = provider_class
+
+        return self._class
+
+
+MANIFEST = (
+    ProviderEntry(
+        "bing",
+        "bing",
+        "Bing",
+        ProviderCapability.TRANSLATION,
+        ProviderFeature.DETECTION | ProviderFeature.PRONUNCIATION,
+        requires=("bs4",),
+    ),
+    ProviderEntry(
+        "deepl",
+        "deepl",
+        "DeepL",
+        ProviderCapability.TRANSLATION,
+        ProviderFeature.DETECTION
+        | ProviderFeature.API_KEY
+        | ProviderFeature.API_KEY_REQUIRED
+        | ProviderFeature.API_KEY_USAGE,
+    ),
+    ProviderEntry(
+        "google",
+        "google",
+        "Google",
+        ProviderCapability.TRANSLATION | ProviderCapability.TTS,
+        ProviderFeature.DETECTION | ProviderFeature.MISTAKES | ProviderFeature.PRONUNCIATION,
+        requires=("gtts",),
+    ),
+    ProviderEntry(
+        "kagi",
+        "kagi",
+        "Kagi Translate",
+        ProviderCapability.TRANSLATION,
+        ProviderFeature.DETECTION | ProviderFeature.API_KEY | ProviderFeature.API_KEY_REQUIRED,
+    ),
+    ProviderEntry(
+        "libretrans",
+        "libretranslate",
+        "LibreTranslate",
+        ProviderCapability.TRANSLATION,
+        ProviderFeature.INSTANCES | ProviderFeature.DETECTION,
+    ),
+    ProviderEntry(
+        "lingva",
+        "lingva",
+        "Lingva Translate",
+        ProviderCapability.TRANSLATION | ProviderCapability.TTS,
+        ProviderFeature.INSTANCES
+        | ProviderFeature.DETECTION
+        | ProviderFeature.MISTAKES
+        | ProviderFeature.PRONUNCIATION,
+    ),
+    ProviderEntry(
+        "yandex",
+        "yandex",
+        "Yandex",
+        ProviderCapability.TRANSLATION,
+        ProviderFeature.DETECTION,
+    ),
+)
+""" Known providers, in the order they are listed """
@@ -0,0 +1,202 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TextIO
+
+from gi.repository import GLib, Soup
+
+COLLECT_METRICS = bool(os.environ.get("DIALECT_NETWORK_METRICS"))
+""" If network metrics are collected, enabled with the ``DIALECT_NETWORK_METRICS`` env var """
+
+
+def _phase(start: int, end: int) -> float | None:
+    """Milliseconds between two metrics timestamps or None if the phase didn't happen."""
+    if not start or not end:
+        return None
+    return (end - start) / 1000
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """
+    Timings and sizes of a provider request.
+
+    Phases are in milliseconds and None if they didn't happen, e.g. DNS, connect and TLS are skipped
+    when a kept-alive connection is reused.
+    """
+
+    timestamp: float
+    """ Unix time the request finished """
+    provider: str
+    """ Name of the provider """
+    endpoint: str
+    """ Host the request was sent to, paths aren't recorded as some contain the text to translate """
+    method: str
+    """ HTTP method """
+    status: int
+    """ HTTP status of the last attempt, 0 if it failed before getting a response """
+    retries: int
+    """ Number of retries """
+    dns: float | None
+    """ Host name resolution """
+    connect: float | None
+    """ Connection establishment, including the TLS handshake """
+    tls: float | None
+    """ TLS handshake """
+    ttfb: float | None
+    """ Time from sending the request to receiving the first byte of the response """
+    body: float | None
+    """ Response reading, from the first to the last byte """
+    network: float | None
+    """ Total network time of the last attempt """
+    duration: float
+    """ Total time spent by the client, including retries and parsing """
+    bytes_sent: int
+    """ Request bytes sent, headers included """
+    bytes_received: int
+    """ Response bytes received, headers included """
+
+    @staticmethod
+    def from_message(message: Soup.Message, provider: str, retries: int, duration: float) -> RequestMetrics:
+        """
+        Collect the metrics of a sent message.
+
+        Args:
+            message: The message, ``Soup.MessageFlags.COLLECT_METRICS`` must be set before sending it.
+            provider: Name of the provider.
+            retries: Number of retries of the request.
+            duration: Seconds spent by the client on the request.
+        """
+        metrics = message.get_metrics()
+        uri = message.get_uri()
+        timings = {"dns": None, "connect": None, "tls": None, "ttfb": None, "body": None, "network": None}
+        sent = received = 0
+
+        if metrics is not None:
+            timings = {
+                "dns": _phase(metrics.get_dns_start(), metrics.get_dns_end()),
+                "connect": _phase(metrics.get_connect_start(), metrics.get_connect_end()),
+                "tls": _phase(metrics.get_tls_start(), metrics.get_connect_end()),
+                "ttfb": _phase(metrics.get_request_start(), metrics.get_response_start()),
+                "body": _phase(metrics.get_response_start(), metrics.get_response_end()),
+                "network": _phase(metrics.get_fetch_start(), metrics.get_response_end()),
+            }
+            sent = metrics.get_request_header_bytes_sent() + metrics.get_request_body_bytes_sent()
+            received = metrics.get_response_header_bytes_received() + metrics.get_response_body_bytes_received()
+
+        return RequestMetrics(
+            timestamp=time.time(),
+            provider=provider,
+            endpoint=uri.get_host() if uri else "",
+            method=message.get_method(),
+            status=int(message.get_status()),
+            retries=retries,
+            duration=duration * 1000,
+            bytes_sent=sent,
+            bytes_received=received,
+            **timings,
+        )
+
+
+class NetworkMetrics:
+    """
+    Ring buffer of the metrics of the latest provider requests.
+
+    Collection is opt-in, see ``COLLECT_METRICS``.
+    """
+
+    instance = None
+
+    def __init__(self, enabled: bool = COLLECT_METRICS, size: int = 1000):
+        self.enabled = enabled
+        """ If requests metrics are collected """
+        self.records: deque[RequestMetrics] = deque(maxlen=size)
+        """ Metrics of the latest requests, oldest first """
+
+    @staticmethod
+    def get() -> NetworkMetrics:
+        """Return an active instance of NetworkMetrics."""
+        if NetworkMetrics.instance is None:
+            NetworkMetrics.instance = NetworkMetrics()
+        return NetworkMetrics.instance
+
+    def prepare(self, message: Soup.Message) -> None:
+        """Ask Soup to collect the metrics of a message before sending it, if collection is enabled."""
+        if self.enabled:
+            message.add_flags(Soup.MessageFlags.COLLECT_METRICS)
+
+    def record(self, message: Soup.Message, provider: str, retries: int, duration: float) -> None:
+        """
+        Store the metrics of a sent message, if collection is enabled.
+
+        Args:
+            message: The message.
+            provider: Name of the provider.
+            retries: Number of retries of the request.
+            duration: Seconds spent by the client on the request.
+        """
+        if self.enabled:
+            self.records.append(RequestMetrics.from_message(message, provider, retries, duration))
+
+    def query(
+        self, provider: str | None = None, endpoint: str | None = None, since: float | None = None
+    ) -> list[RequestMetrics]:
+        """
+        Get the stored metrics matching the given filters.
+
+        Args:
+            provider: Name of the provider.
+            endpoint: Host of the requests.
+            since: Unix time after which requests finished.
+
+        Returns:
+            The matching records, oldest first.
+        """
+        return [
+            record
+            for record in self.records
+            if (provider is None or record.provider == provider)
+            and (endpoint is None or record.endpoint == endpoint)
+            and (since is None or record.timestamp >= since)
+        ]
+
+    def dump(self, file: TextIO) -> int:
+        """
+        Write the stored metrics as JSON lines.
+
+        Args:
+            file: Text file to write to.
+
+        Returns:
+            Number of records written.
+        """
+        for record in self.records:
+            file.write(json.dumps(dataclasses.asdict(record)) + "\n")
+        return len(self.records)
+
+    def save(self) -> None:
+        """Append the stored metrics to ``dialect/network-metrics.jsonl`` in the user cache dir, if enabled."""
+        if not self.enabled or not self.records:
+            return
+
+        path = os.path.join(GLib.get_user_cache_dir(), "dialect", "network-metrics.jsonl")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a") as file:
+                count = self.dump(file)
+            logging.info(f"Saved {count} network metrics records to {path}")
+        except OSError as exc:
+            logging.warning(f"Failed saving network metrics: {exc}")
+
+    def clear(self) -> None:
+        """Delete the stored metrics."""
+        self.records.clear()
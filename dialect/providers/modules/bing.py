@@ -1,12 +1,15 @@
 # Copyright 2023 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import asyncio
 import re
+from contextlib import aclosing
 
 from bs4 import BeautifulSoup, Tag
 
 from dialect.providers.base import ProviderCapability, ProviderFeature, Translation, TranslationPronunciation
 from dialect.providers.errors import ProviderError, UnexpectedError
+from dialect.providers.ratelimit import RateLimit
 from dialect.providers.soup import SoupProvider
 
 
@@ -16,6 +19,8 @@ class Provider(SoupProvider):
 
     capabilities = ProviderCapability.TRANSLATION
     features = ProviderFeature.DETECTION | ProviderFeature.PRONUNCIATION
+    rate_limit = RateLimit(requests_per_second=2, max_concurrency=2, burst=4)
+    max_body_size = 8 * 1024 * 1024
 
     defaults = {
         "instance_url": "",
@@ -37,6 +42,7 @@ class Provider(SoupProvider):
         self._ig = ""
         self._iid = ""
         self._count = 1
+        self._session_lock = asyncio.Lock()
 
     @property
     def html_url(self):
@@ -53,11 +59,16 @@ class Provider(SoupProvider):
         return self.format_url("www.bing.com", "/ttranslatev3", params)
 
     async def init_trans(self):
-        response = await self.get(self.html_url, self._headers, check_common=False, return_json=False)
+        html = bytearray()
+        async with aclosing(self.stream(self.html_url, self._headers)) as chunks:
+            async for chunk in chunks:
+                html += chunk
 
-        if response:
+        if html:
             try:
-                soup = BeautifulSoup(response, "html.parser")
+                # Decode response bytes once, for both the HTML parser and the regexes
+                text = html.decode("utf-8")
+                soup = BeautifulSoup(text, "html.parser")
 
                 # Get Langs
                 langs = soup.find("optgroup", {"id": "t_tgtAllLang"})
@@ -71,9 +82,6 @@ class Provider(SoupProvider):
                 if isinstance(iid, Tag):
                     self._iid = iid["data-iid"]
 
-                # Decode response bytes
-                text = response.decode("utf-8")
-
                 # Look for abuse prevention data
                 params = re.findall(r"var params_AbusePreventionHelper = \[(.*?)\];", text)[0]  # noqa
                 abuse_params = params.replace('"', "").split(",")
@@ -90,6 +98,12 @@ class Provider(SoupProvider):
             raise UnexpectedError("Could not get HTML from bing.com")
 
     async def translate(self, request):
+        # Session vars are not restored with the cached provider state
+        if not self._token:
+            async with self._session_lock:
+                if not self._token:  # Concurrent calls get the session of the first one
+                    await self.init_trans()
+
         src, dest = self.denormalize_lang(request.src, request.dest)
 
         # Increment requests count
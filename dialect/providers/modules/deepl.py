@@ -2,8 +2,22 @@
 # Copyright 2024 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from dialect.providers.base import ProviderCapability, ProviderFeature, ProviderLangComparison, Translation
-from dialect.providers.errors import APIKeyInvalid, APIKeyRequired, ServiceLimitReached, UnexpectedError
+from dialect.providers.base import (
+    ProviderCapability,
+    ProviderFeature,
+    ProviderLangComparison,
+    Translation,
+    TranslationRequest,
+)
+from dialect.providers.errors import (
+    APIKeyInvalid,
+    APIKeyRequired,
+    BatchSizeExceeded,
+    ServiceLimitReached,
+    UnexpectedError,
+)
+from dialect.providers.ratelimit import RateLimit
+from dialect.providers.retry import RetryPolicy
 from dialect.providers.soup import SoupProvider
 
 API_V = "v2"
@@ -21,6 +35,9 @@ class Provider(SoupProvider):
         | ProviderFeature.API_KEY_USAGE
     )
     lang_comp = ProviderLangComparison.DEEP
+    batch_size = 50
+    rate_limit = RateLimit(requests_per_second=10, max_concurrency=4)
+    retry_policy = RetryPolicy(statuses=(429,), base_delay=1.0)
 
     defaults = {
         "instance_url": "",
@@ -35,7 +52,6 @@ class Provider(SoupProvider):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.retry_errors = (429,)
         self.chars_limit = 5000
 
         # DeepL API Free keys can be identified by the suffix ":fx"
@@ -66,8 +82,8 @@ class Provider(SoupProvider):
 
     async def init_trans(self):
         # Get languages
-        src_langs = await self.get(self.source_lang_url, self.headers)
-        dest_langs = await self.get(self.target_lang_url, self.headers)
+        src_langs = await self.get(self.source_lang_url, self.headers, cache=True)
+        dest_langs = await self.get(self.target_lang_url, self.headers, cache=True)
 
         if src_langs and dest_langs and isinstance(src_langs, list) and isinstance(dest_langs, list):
             for lang in src_langs:
@@ -87,11 +103,17 @@ class Provider(SoupProvider):
             return False
 
     async def translate(self, request):
-        src, dest = self.denormalize_lang(request.src, request.dest)
+        return (await self._translate_texts([request]))[0]
+
+    async def translate_batch(self, requests):
+        return await self._translate_texts(requests)
+
+    async def _translate_texts(self, requests: list[TranslationRequest]) -> list[Translation]:
+        src, dest = self.denormalize_lang(requests[0].src, requests[0].dest)
 
         # Request body
         data = {
-            "text": [request.text],
+            "text": [request.text for request in requests],
             "target_lang": dest,
         }
         if src != "auto":
@@ -99,13 +121,14 @@ class Provider(SoupProvider):
 
         response = await self.post(self.translate_url, data, self.headers)
 
-        # Read translation
+        # Read translations
         if response and isinstance(response, dict):
             translations: list[dict[str, str]] | None = response.get("translations")
-            if translations:
-                detected = translations[0].get("detected_source_language")
-                translation = Translation(translations[0]["text"], request, detected)
-                return translation
+            if translations and len(translations) == len(requests):
+                return [
+                    Translation(translation["text"], request, translation.get("detected_source_language"))
+                    for translation, request in zip(translations, requests)
+                ]
 
         raise UnexpectedError
 
@@ -129,6 +152,8 @@ class Provider(SoupProvider):
                 if not self.api_key:
                     raise APIKeyRequired(message)
                 raise APIKeyInvalid(message)
+            case 413:
+                raise BatchSizeExceeded(message)
             case 456:
                 raise ServiceLimitReached(message)
             case 429:
@@ -4,21 +4,25 @@
 
 import html
 import json
-import random
 import re
+import time
 from tempfile import NamedTemporaryFile
 
 from gtts import gTTS, lang
 
+from dialect.providers import jsonlib
 from dialect.providers.base import (
     ProviderCapability,
     ProviderFeature,
     Translation,
     TranslationMistake,
     TranslationPronunciation,
+    TranslationRequest,
 )
-from dialect.providers.errors import UnexpectedError
+from dialect.providers.errors import RequestCancelled, RequestError, UnexpectedError
+from dialect.providers.hostpool import HostPool
 from dialect.providers.local import LocalProvider
+from dialect.providers.ratelimit import RateLimit
 from dialect.providers.soup import SoupProvider
 
 RPC_ID = "MkEWBc"
@@ -225,12 +229,34 @@ TRANSLATE_TLDS = (
 )
 
 
+BATCHEXECUTE_GUARD = b")]}'"
+""" Anti-XSSI prefix of batchexecute responses """
+
+
+def parse_batchexecute(response: bytes | bytearray) -> list[list]:
+    """
+    Parse a batchexecute response into its envelopes.
+
+    The response is a ``)]}'`` guard followed by JSON frames, see ``jsonlib.loads_frames``.
+
+    Args:
+        response: The response body.
+
+    Returns:
+        The envelopes of all the frames, like ``["wrb.fr", rpc_id, payload, ...]``.
+    """
+    return [envelope for frame in jsonlib.loads_frames(response, BATCHEXECUTE_GUARD) for envelope in frame]
+
+
 class Provider(LocalProvider, SoupProvider):
     name = "google"
     prettyname = "Google"
 
     capabilities = ProviderCapability.TRANSLATION | ProviderCapability.TTS
     features = ProviderFeature.DETECTION | ProviderFeature.MISTAKES | ProviderFeature.PRONUNCIATION
+    rate_limit = RateLimit(requests_per_second=5, max_concurrency=4, burst=10)
+    batch_size = 10
+    batch_mixed_langs = True
 
     defaults = {
         "instance_url": "",
@@ -253,7 +279,7 @@ class Provider(LocalProvider, SoupProvider):
         langs_url = self.format_url(
             self._get_translate_host(".com"), "/translate_a/l", {"client": "t", "alpha": "true"}
         )
-        response = await self.get(langs_url, self._headers, False)
+        response = await self.get(langs_url, self._headers, False, cache=True)
 
         try:
             for code, name in response["tl"].items():
@@ -266,7 +292,7 @@ class Provider(LocalProvider, SoupProvider):
             self.add_lang(code, trans_src=False, trans_dest=False, tts=True)
 
     @staticmethod
-    def _build_rpc_request(text: str, src: str, dest: str):
+    def _build_rpc_request(texts: list[tuple[str, str, str]], ids: list[str]):
         return json.dumps(
             [
                 [
@@ -274,21 +300,33 @@ class Provider(LocalProvider, SoupProvider):
                         RPC_ID,
                         json.dumps([[text, src, dest, True], [None]], separators=(",", ":")),
                         None,
-                        "generic",
-                    ],
+                        rpc_index,
+                    ]
+                    for (text, src, dest), rpc_index in zip(texts, ids)
                 ]
             ],
             separators=(",", ":"),
         )
 
-    def _get_translate_host(self, tld: str | None = None):
-        if not tld:
-            tld = random.choice(TRANSLATE_TLDS)
+    def _get_translate_host(self, tld: str):
         return f"translate.google{tld}"
 
+    @property
+    def host_pool(self) -> HostPool:
+        """
+        Pool of the translate hosts, shared by the provider instances.
+
+        Requests stick to a healthy host so its connection is reused, rotating hosts on errors
+        or throttling.
+        """
+        return HostPool.get(self.name, [self._get_translate_host(tld) for tld in TRANSLATE_TLDS])
+
     @property
     def translate_url(self):
-        url = TRANSLATE_RPC.format(host=self._get_translate_host()) + "?"
+        return self._get_translate_url(self.host_pool.pick())
+
+    def _get_translate_url(self, host: str):
+        url = TRANSLATE_RPC.format(host=host) + "?"
         params = {
             "rpcids": RPC_ID,
             "bl": "boq_translate-webserver_20201207.13_p0",
@@ -301,43 +339,61 @@ class Provider(LocalProvider, SoupProvider):
         return self.format_url(url, params=params)
 
     async def translate(self, request):
-        src_lang, dest_lang = self.denormalize_lang(request.src, request.dest)
+        return (await self._translate_texts([request]))[0]
+
+    async def translate_batch(self, requests):
+        return await self._translate_texts(requests)
+
+    async def _translate_texts(self, requests: list[TranslationRequest]) -> list[Translation]:
+        langs = [self.denormalize_lang(request.src, request.dest) for request in requests]
+        # Responses are matched to their envelope by index, a single envelope uses the generic one
+        ids = ["generic"] if len(requests) == 1 else [str(index) for index in range(1, len(requests) + 1)]
 
         # Form data
+        texts = [(request.text, src, dest) for request, (src, dest) in zip(requests, langs)]
         data = {
-            "f.req": self._build_rpc_request(request.text, src_lang, dest_lang),
+            "f.req": self._build_rpc_request(texts, ids),
         }
 
         # Do request
-        response = await self.post(self.translate_url, data, self._headers, True, False, False)
+        host = self.host_pool.pick()
+        start = time.monotonic()
+        try:
+            response = await self.post(self._get_translate_url(host), data, self._headers, True, True, False)
+        except RequestCancelled:
+            raise
+        except RequestError:
+            # Throttled requests get an error status instead of the RPC response
+            self.host_pool.report(host, False)
+            raise
+
+        self.host_pool.report(host, True, time.monotonic() - start)
+
+        try:
+            envelopes = {
+                env[6]: env for env in parse_batchexecute(response) if env[:2] == ["wrb.fr", RPC_ID] and len(env) > 6
+            }
+        except Exception as exc:
+            raise UnexpectedError from exc
 
+        translations: list[Translation] = []
+        for rpc_index, request, (src, dest) in zip(ids, requests, langs):
+            try:
+                parsed = jsonlib.loads(envelopes[rpc_index][2])
+            except Exception as exc:
+                if len(requests) == 1:
+                    raise UnexpectedError from exc
+
+                # Only retry the texts missing from the batch response
+                translations += await self._translate_texts([request])
+                continue
+
+            translations.append(self._read_translation(parsed, request, src, dest))
+
+        return translations
+
+    def _read_translation(self, parsed: list, request: TranslationRequest, src_lang: str, dest_lang: str):
         try:
-            token_found = False
-            square_bracket_counts = [0, 0]
-            resp = ""
-            data = response.decode("utf-8")
-
-            for line in data.split("\n"):
-                token_found = token_found or f'"{RPC_ID}"' in line[:30]
-                if not token_found:
-                    continue
-
-                is_in_string = False
-                for index, char in enumerate(line):
-                    if char == '"' and line[max(0, index - 1)] != "\\":
-                        is_in_string = not is_in_string
-                    if not is_in_string:
-                        if char == "[":
-                            square_bracket_counts[0] += 1
-                        elif char == "]":
-                            square_bracket_counts[1] += 1
-
-                resp += line
-                if square_bracket_counts[0] == square_bracket_counts[1]:
-                    break
-
-            data = json.loads(resp)
-            parsed = json.loads(data[0][2])
             translated_parts = None
             translated = None
             try:
@@ -417,6 +473,11 @@ class Provider(LocalProvider, SoupProvider):
         except Exception as exc:
             raise UnexpectedError from exc
 
+    def check_known_errors(self, status, data):
+        """Raises ``RequestError`` for HTTP errors, the host failed or throttled the request."""
+        if status != 200:
+            raise RequestError(f"HTTP {status} error")
+
     def _strip_html_tags(self, text: str):
         """Strip html tags"""
         tags_re = re.compile(r"(<!--.*?-->|<[^>]*>)")
@@ -62,7 +62,7 @@ class Provider(SoupProvider):
 
     async def init_trans(self):
         """Initialize translation capabilities by fetching supported languages"""
-        languages = await self.get(self.lang_url, self.headers)
+        languages = await self.get(self.lang_url, self.headers, cache=True)
 
         if languages and isinstance(languages, list):
             for lang in languages:
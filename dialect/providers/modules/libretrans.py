@@ -6,6 +6,7 @@ from dialect.providers.base import (
     ProviderCapability,
     ProviderFeature,
     Translation,
+    TranslationRequest,
 )
 from dialect.providers.errors import (
     APIKeyInvalid,
@@ -58,7 +59,7 @@ class Provider(SoupProvider):
         return self.format_url(self.instance_url, "/translate")
 
     async def validate_instance(self, url):
-        response = await self.get(self.format_url(url, "/spec"), check_common=False)
+        response = await self.get(self.format_url(url, "/spec"), check_common=False, cache=True)
         valid = False
 
         try:
@@ -82,8 +83,8 @@ class Provider(SoupProvider):
             return False
 
     async def init_trans(self):
-        languages = await self.get(self.lang_url)
-        settings = await self.get(self.frontend_settings_url)
+        languages = await self.get(self.lang_url, cache=True)
+        settings = await self.get(self.frontend_settings_url, cache=True)
 
         try:
             for lang in languages:
@@ -102,11 +103,17 @@ class Provider(SoupProvider):
             raise UnexpectedError from exc
 
     async def translate(self, request):
-        src, dest = self.denormalize_lang(request.src, request.dest)
+        return (await self._translate_texts([request]))[0]
+
+    async def translate_batch(self, requests):
+        return await self._translate_texts(requests)
+
+    async def _translate_texts(self, requests: list[TranslationRequest]) -> list[Translation]:
+        src, dest = self.denormalize_lang(requests[0].src, requests[0].dest)
 
         # Request body
         data = {
-            "q": request.text,
+            "q": [request.text for request in requests],
             "source": src,
             "target": dest,
         }
@@ -116,8 +123,16 @@ class Provider(SoupProvider):
         # Do request
         response = await self.post(self.translate_url, data)
         try:
-            detected = response.get("detectedLanguage", {}).get("language", None)
-            return Translation(response["translatedText"], request, detected)
+            texts = response["translatedText"]
+            detected = response.get("detectedLanguage") or [{}] * len(texts)
+
+            if len(texts) != len(requests):
+                raise UnexpectedError("Translations count mismatch")
+
+            return [
+                Translation(text, request, lang.get("language", None))
+                for text, lang, request in zip(texts, detected, requests)
+            ]
         except Exception as exc:
             raise UnexpectedError from exc
 
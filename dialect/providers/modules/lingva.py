@@ -61,7 +61,7 @@ class Provider(SoupProvider):
         return valid
 
     async def init(self) -> None:
-        response = await self.get(self.lang_url)
+        response = await self.get(self.lang_url, cache=True)
 
         try:
             if "languages" in response:
@@ -1,10 +1,10 @@
 # Copyright 2023 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import json
-import re
+from contextlib import aclosing
 from uuid import uuid4
 
+from dialect.providers import jsonlib
 from dialect.providers.base import (
     ProviderCapability,
     ProviderFeature,
@@ -12,6 +12,7 @@ from dialect.providers.base import (
     Translation,
 )
 from dialect.providers.errors import ProviderError, UnexpectedError
+from dialect.providers.ratelimit import RateLimit
 from dialect.providers.soup import SoupProvider
 
 
@@ -22,6 +23,7 @@ class Provider(SoupProvider):
     capabilities = ProviderCapability.TRANSLATION
     features = ProviderFeature.DETECTION
     lang_comp = ProviderLangComparison.DEEP
+    rate_limit = RateLimit(requests_per_second=5, max_concurrency=4)
 
     defaults = {
         "instance_url": "",
@@ -50,27 +52,53 @@ class Provider(SoupProvider):
         # Get Yandex Translate web HTML to parse languages
         # Using `/api/v1/tr.json/getLangs` doesn't provide all the languages that Yandex supports
         html_url = self.format_url("translate.yandex.com")
-        response = await self.get(html_url, check_common=False, return_json=False)
-
-        if response:
-            try:
-                # Decode response bytes
-                text = response.decode("utf-8")
-                # Get Yandex languages
-                languages = re.findall(r"TRANSLATOR_LANGS: (.*?),\n", text)[0]  # noqa
-                languages: dict[str, str] = json.loads(languages)  # type: ignore
-                # Get Yandex dialects list, dialects aren't valid src tranlation langs
-                dialects = re.findall(r"DIALECTS: (.*?),\n", text)[0]  # noqa
-                dialects: list[str] = json.loads(dialects)  # type: ignore
-                # Populate languages lists
-                for code, name in languages.items():
-                    self.add_lang(code, name, trans_src=code not in dialects)
-
-            except Exception as exc:
-                raise UnexpectedError("Failed parsing HTML from yandex.com") from exc
-        else:
+        markers = {
+            "languages": b"TRANSLATOR_LANGS: ",
+            # Dialects aren't valid src tranlation langs
+            "dialects": b"DIALECTS: ",
+        }
+        end_marker = b",\n"
+        starts: dict[str, int] = {}
+        found: dict[str, bytes] = {}
+        html = bytearray()
+
+        # Stop downloading the page once the data we need is found
+        async with aclosing(self.stream(html_url)) as chunks:
+            async for chunk in chunks:
+                # Only search the new chunk, plus enough of the previous one for a marker cut between them
+                searched = len(html)
+                html += chunk
+
+                for key, marker in markers.items():
+                    if key in found:
+                        continue
+
+                    if key not in starts:
+                        index = html.find(marker, max(0, searched - len(marker) + 1))
+                        if index == -1:
+                            continue
+                        starts[key] = index + len(marker)
+
+                    end = html.find(end_marker, max(starts[key], searched - len(end_marker) + 1))
+                    if end != -1:
+                        found[key] = bytes(html[starts[key] : end])
+
+                if len(found) == len(markers):
+                    break
+
+        if not html:
             raise UnexpectedError("Could not get HTML from yandex.com")
 
+        try:
+            languages: dict[str, str] = jsonlib.loads(found["languages"])
+            dialects: list[str] = jsonlib.loads(found["dialects"])
+            # Populate languages lists
+            for code, name in languages.items():
+                self.add_lang(code, name, trans_src=code not in dialects)
+
+        except Exception as exc:
+            raise UnexpectedError("Failed parsing HTML from yandex.com") from exc
+
     async def translate(self, request):
         src, dest = self.denormalize_lang(request.src, request.dest)
         # Form data
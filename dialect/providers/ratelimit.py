@@ -0,0 +1,213 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from gi.repository import Gio
+
+from dialect.providers.cancellable import await_cancellable
+from dialect.providers.errors import RequestCancelled
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Client-side limits of the requests sent to a provider, 0 means unlimited."""
+
+    requests_per_second: float = 0
+    """ Sustained number of requests per second """
+    chars_per_minute: int = 0
+    """ Sustained number of characters sent per minute """
+    max_concurrency: int = 0
+    """ Max number of requests in flight at the same time """
+    burst: int = 0
+    """ Number of requests that can be sent at once before being throttled, defaults to one second worth """
+
+
+class TokenBucket:
+    """
+    Token bucket where takers reserve tokens in advance.
+
+    Tokens can go into debt, a taker waits until its debt is refilled, so takers are served in order
+    and amounts bigger than the capacity are still allowed.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        """ Tokens refilled per second """
+        self.capacity = capacity
+        """ Max number of tokens """
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            amount: Number of tokens to take.
+
+        Returns:
+            Seconds to wait until the taken tokens are available.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= amount
+
+        return max(-self._tokens / self.rate, 0.0)
+
+    def refund(self, amount: float) -> None:
+        """Give back tokens that weren't used."""
+        self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """
+    Queues requests to a provider according to its ``RateLimit``.
+
+    Limiters are shared by all the instances of a provider.
+    """
+
+    instances: dict[str, RateLimiter] = {}
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        """ Limits applied """
+
+        self.queued = 0
+        """ Number of requests waiting for their turn """
+        self.max_queued = 0
+        """ Max number of requests that waited at the same time """
+        self.throttled = 0
+        """ Number of requests that had to wait """
+        self.wait_time = 0.0
+        """ Total seconds requests waited """
+        self.max_wait_time = 0.0
+        """ Max seconds a request waited """
+
+        self._requests = None
+        if limit.requests_per_second > 0:
+            burst = limit.burst or max(1, math.ceil(limit.requests_per_second))
+            self._requests = TokenBucket(limit.requests_per_second, burst)
+
+        self._chars = None
+        if limit.chars_per_minute > 0:
+            self._chars = TokenBucket(limit.chars_per_minute / 60, limit.chars_per_minute)
+
+        self._slots = asyncio.Semaphore(limit.max_concurrency) if limit.max_concurrency > 0 else None
+
+    @staticmethod
+    def get(name: str, limit: RateLimit) -> RateLimiter:
+        """
+        Return the active RateLimiter of a provider.
+
+        Args:
+            name: The provider name.
+            limit: The provider limits, a new limiter is created if they changed.
+        """
+        limiter = RateLimiter.instances.get(name)
+        if limiter is None or limiter.limit != limit:
+            limiter = RateLimiter.instances[name] = RateLimiter(limit)
+        return limiter
+
+    @asynccontextmanager
+    async def acquire(self, chars: int = 0, cancellable: Gio.Cancellable | None = None) -> AsyncIterator[None]:
+        """
+        Wait until a request is allowed, holding a concurrency slot while the context is active.
+
+        Args:
+            chars: Number of characters the request sends.
+            cancellable: Cancellable of the request, to stop waiting for its turn.
+
+        Raises:
+            RequestCancelled: If the cancellable is cancelled while waiting.
+        """
+        start = time.monotonic()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+        try:
+            delay = self._requests.reserve(1) if self._requests else 0.0
+            if self._chars and chars:
+                delay = max(delay, self._chars.reserve(chars))
+
+            try:
+                await self._wait(delay, cancellable)
+            except BaseException:
+                # Give back the reserved tokens of a cancelled request
+                self.refund(chars)
+                raise
+        finally:
+            self.queued -= 1
+
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            self.throttled += 1
+        self.wait_time += waited
+        self.max_wait_time = max(self.max_wait_time, waited)
+
+        try:
+            yield
+        finally:
+            if self._slots:
+                self._slots.release()
+
+    def refund(self, chars: int = 0) -> None:
+        """
+        Give back the tokens taken by a request that wasn't sent.
+
+        Args:
+            chars: Number of characters the request would have sent.
+        """
+        if self._requests:
+            self._requests.refund(1)
+        if self._chars and chars:
+            self._chars.refund(chars)
+
+    async def _wait(self, delay: float, cancellable: Gio.Cancellable | None) -> None:
+        """Sleep for delay and take a concurrency slot, unless the cancellable is cancelled first."""
+        if cancellable is not None and cancellable.is_cancelled():
+            raise RequestCancelled("Request was cancelled")
+
+        if not delay and (self._slots is None or not self._slots.locked()):
+            if self._slots:
+                await self._slots.acquire()  # Doesn't block
+            return
+
+        waiter = asyncio.ensure_future(self._sleep_and_take_slot(delay))
+        try:
+            await await_cancellable(waiter, cancellable)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    async def _sleep_and_take_slot(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        if self._slots:
+            await self._slots.acquire()
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """Stop a wait, giving back the slot if it was already taken."""
+        if not waiter.done():
+            waiter.cancel()
+        elif self._slots and not waiter.cancelled() and waiter.exception() is None:
+            self._slots.release()
+
+    def stats(self) -> dict[str, int | float]:
+        """Get the limiter counters."""
+        return {
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "throttled": self.throttled,
+            "wait_time": self.wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
@@ -0,0 +1,165 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import NamedTuple, overload
+
+
+class LangParts(NamedTuple):
+    """Parts of a normalized lang code."""
+
+    base: str
+    """ Language code, e.g. zh """
+    script: str | None
+    """ ISO 15924 script code, e.g. Hans """
+    region: str | None
+    """ ISO 3166-1 country code, e.g. CN """
+
+
+def split_lang_code(code: str) -> LangParts:
+    """
+    Split a normalized lang code in its parts.
+
+    Args:
+        code: A code normalized with ``BaseProvider.normalize_lang_code``.
+
+    Returns:
+        The code parts.
+    """
+    base, _sep, rest = code.partition("-")
+    script = region = None
+
+    for part in rest.split("-") if rest else ():
+        if len(part) == 4:
+            script = part
+        else:
+            region = part
+
+    return LangParts(base, script, region)
+
+
+class LanguageSet(Sequence[str]):
+    """Insertion ordered set of lang codes, supporting indexing."""
+
+    def __init__(self, codes: Iterable[str] = ()):
+        self._codes: list[str] = []
+        self._positions: dict[str, int] = {}
+
+        for code in codes:
+            self.add(code)
+
+    def add(self, code: str) -> bool:
+        """
+        Add a lang code if missing.
+
+        Returns:
+            If the code was added.
+        """
+        if code in self._positions:
+            return False
+
+        self._positions[code] = len(self._codes)
+        self._codes.append(code)
+        return True
+
+    def clear(self) -> None:
+        """Remove all the lang codes."""
+        self._codes.clear()
+        self._positions.clear()
+
+    def index(self, code: str, start: int = 0, stop: int | None = None) -> int:
+        position = self._positions.get(code)
+        if position is None or position < start or (stop is not None and position >= stop):
+            raise ValueError(f"{code} is not in the set")
+        return position
+
+    def count(self, code: str) -> int:
+        return int(code in self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        return self._codes[index]
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LanguageSet):
+            return self._codes == other._codes
+        if isinstance(other, list):
+            return self._codes == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LanguageSet({self._codes!r})"
+
+
+class LanguageRegistry:
+    """
+    Bookkeeping of the languages supported by a provider.
+
+    It keeps the supported codes in ordered sets and caches lang codes normalization and parts.
+    """
+
+    def __init__(self):
+        self.src = LanguageSet()
+        """ Source languages available for translating """
+        self.dest = LanguageSet()
+        """ Destination languages available for translating """
+        self.tts = LanguageSet()
+        """ Languages available for TTS """
+        self.nonstandard: dict[str, str] = {}
+        """ Mapping of lang codes that differ with Dialect ones """
+        self.names: dict[str, str] = {}
+        """ Names of languages provided by the service """
+
+        self._normalized: dict[str, str] = {}
+        self._parts: dict[str, LangParts] = {}
+
+    def clear(self) -> None:
+        """Remove all the registered languages."""
+        self.src.clear()
+        self.dest.clear()
+        self.tts.clear()
+        self.nonstandard.clear()
+        self.names.clear()
+
+    def get_normalized(self, code: str) -> str | None:
+        """Get the cached normalization of a lang code."""
+        return self._normalized.get(code)
+
+    def set_normalized(self, code: str, normalized: str) -> None:
+        """Cache the normalization of a lang code."""
+        self._normalized[code] = normalized
+
+    def parts(self, code: str) -> LangParts:
+        """
+        Get the parts of a normalized lang code, cached.
+
+        Args:
+            code: A normalized lang code.
+
+        Returns:
+            The code parts.
+        """
+        parts = self._parts.get(code)
+        if parts is None:
+            parts = self._parts[code] = split_lang_code(code)
+        return parts
+
+    def denormalize(self, code: str) -> str:
+        """Get the provider code of a normalized lang code."""
+        return self.nonstandard.get(code, code)
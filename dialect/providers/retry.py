@@ -0,0 +1,146 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+""" HTTP methods that are safe to send again """
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse the value of a Retry-After header.
+
+    Args:
+        value: Delay in seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait or None if missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How failed requests to a provider are retried.
+
+    Requests refused with one of ``statuses`` weren't processed by the server, so they are retried for
+    any method. Transport errors and ``idempotent_statuses`` are only retried for idempotent methods.
+    """
+
+    statuses: tuple[int, ...] = ()
+    """ HTTP statuses always retried, e.g. 429 """
+    idempotent_statuses: tuple[int, ...] = (502, 503, 504)
+    """ HTTP statuses retried for idempotent requests """
+    transport_errors: bool = True
+    """ If connection errors are retried for idempotent requests """
+    idempotent_post: bool = False
+    """ If POST requests can be considered idempotent """
+    max_retries: int = 5
+    """ Max number of retries of a request """
+    base_delay: float = 0.5
+    """ Min seconds to wait before a retry """
+    max_delay: float = 16.0
+    """ Max seconds to wait before a retry, unless the server asks for more with Retry-After """
+    deadline: float = 60.0
+    """ Max total seconds spent on a request including its retries """
+
+    def is_idempotent(self, method: str) -> bool:
+        """Check if requests with the given HTTP method can be sent again safely."""
+        return method in IDEMPOTENT_METHODS or (self.idempotent_post and method == "POST")
+
+    def should_retry_status(self, status: int, method: str) -> bool:
+        """Check if a response with the given status should be retried."""
+        return status in self.statuses or (status in self.idempotent_statuses and self.is_idempotent(method))
+
+    def next_delay(self, previous: float, retry_after: float | None = None) -> float:
+        """
+        Get the seconds to wait before the next retry, using decorrelated jitter.
+
+        Args:
+            previous: Previous delay, ``RetryPolicy.base_delay`` for the first retry.
+            retry_after: Delay requested by the server.
+
+        Returns:
+            The delay.
+        """
+        if retry_after is not None:
+            return retry_after
+
+        return min(self.max_delay, random.uniform(self.base_delay, max(previous, self.base_delay) * 3))
+
+
+class RetryBudget:
+    """
+    Process-wide limit of retries relative to the number of requests.
+
+    It prevents retries from multiplying the load on services that are already failing.
+    """
+
+    instance = None
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        """ Retries allowed per request sent """
+        self.min_retries = min_retries
+        """ Retries always allowed within the window """
+        self.window = window
+        """ Seconds requests and retries are accounted """
+
+        self.exhausted = 0
+        """ Number of retries denied """
+
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    @staticmethod
+    def get() -> RetryBudget:
+        """Return an active instance of RetryBudget."""
+        if RetryBudget.instance is None:
+            RetryBudget.instance = RetryBudget()
+        return RetryBudget.instance
+
+    def _expire(self, now: float) -> None:
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Account a new request."""
+        now = time.monotonic()
+        self._expire(now)
+        self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """
+        Account a retry if the budget allows it.
+
+        Returns:
+            If the retry can be done.
+        """
+        now = time.monotonic()
+        self._expire(now)
+
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+            self.exhausted += 1
+            return False
+
+        self._retries.append(now)
+        return True
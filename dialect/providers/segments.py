@@ -0,0 +1,119 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import re
+
+BOUNDARY_RE = re.compile(r"\n\s*\n|\n\s*|(?<=[.!?;。！？；…])\s+")
+""" Paragraph, line and sentence boundaries, matching the whitespace between segments """
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _split_long(content: str, start: int, end: int, limit: int) -> list[tuple[int, int]]:
+    """Get the cuts splitting a unit longer than limit at word boundaries, or at the limit as last resort."""
+    cuts: list[tuple[int, int]] = []
+
+    while end - start > limit:
+        spaces = [m for m in WHITESPACE_RE.finditer(content, start + 1, start + limit + 1)]
+        if spaces:
+            # The whole whitespace run, even the part past the limit
+            space = WHITESPACE_RE.match(content, spaces[-1].start(), end)
+            cuts.append(space.span())  # type: ignore
+            start = space.end()  # type: ignore
+        else:
+            cuts.append((start + limit, start + limit))
+            start += limit
+
+    return cuts
+
+
+def _widen_cuts(content: str, cuts: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Extend cuts to the whole whitespace around them, merging the ones left touching."""
+    widened: list[tuple[int, int]] = []
+
+    for start, end in cuts:
+        while start > 0 and content[start - 1].isspace():
+            start -= 1
+        while end < len(content) and content[end].isspace():
+            end += 1
+
+        if widened and start <= widened[-1][1]:
+            widened[-1] = (widened[-1][0], max(widened[-1][1], end))
+        else:
+            widened.append((start, end))
+
+    return widened
+
+
+def split_text(text: str, limit: int) -> tuple[list[str], list[str]]:
+    """
+    Split a text in segments no longer than limit.
+
+    Text is split at paragraph and sentence boundaries when possible, and segments are
+    packed together up to the limit. The whitespace between segments is kept apart so
+    the text can be rebuilt with ``join_segments``.
+
+    Args:
+        text: The text to split.
+        limit: Max number of characters of a segment.
+
+    Returns:
+        The segments and the separators around them, there's always one separator more than segments.
+        Blank texts have no segments.
+    """
+    content = text.strip()
+    if not content:
+        return [], [text]
+
+    start = text.index(content)
+    leading, trailing = text[:start], text[start + len(content) :]
+
+    cuts: list[tuple[int, int]] = []
+    position = 0
+
+    for boundary in [*BOUNDARY_RE.finditer(content), None]:
+        end = boundary.start() if boundary else len(content)
+        cuts.extend(_split_long(content, position, end, limit))
+
+        if boundary:
+            cuts.append(boundary.span())
+            position = boundary.end()
+
+    # Units never start or end with whitespace, so none of them is empty or only whitespace
+    units: list[str] = []
+    separators: list[str] = []
+    position = 0
+    for start, end in _widen_cuts(content, cuts):
+        units.append(content[position:start])
+        separators.append(content[start:end])
+        position = end
+    units.append(content[position:])
+
+    # Pack units in segments as long as possible
+    segments = [units[0]]
+    outer = [leading]
+    for separator, unit in zip(separators, units[1:]):
+        if len(segments[-1]) + len(separator) + len(unit) <= limit:
+            segments[-1] += separator + unit
+        else:
+            segments.append(unit)
+            outer.append(separator)
+    outer.append(trailing)
+
+    return segments, outer
+
+
+def join_segments(segments: list[str], separators: list[str]) -> str:
+    """
+    Rebuild a text split with ``split_text``.
+
+    Args:
+        segments: The segments, usually translated.
+        separators: The separators returned by ``split_text``.
+
+    Returns:
+        The joined text.
+    """
+    text = separators[0]
+    for segment, separator in zip(segments, separators[1:]):
+        text += segment + separator
+    return text
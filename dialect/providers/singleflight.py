@@ -0,0 +1,103 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from gi.repository import Gio
+
+from dialect.providers.cancellable import await_cancellable
+from dialect.providers.errors import RequestCancelled
+
+_T = TypeVar("_T")
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into a single one.
+
+    The first caller of a key runs the call, callers arriving while it's in flight await its result.
+    """
+
+    instance = None
+
+    def __init__(self):
+        self.calls = 0
+        """ Number of calls run """
+        self.coalesced = 0
+        """ Number of calls that awaited an identical in-flight call """
+        self.retried = 0
+        """ Number of coalesced calls run again because the shared call was cancelled """
+
+        self._flights: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def get() -> SingleFlight:
+        """Return an active instance of SingleFlight."""
+        if SingleFlight.instance is None:
+            SingleFlight.instance = SingleFlight()
+        return SingleFlight.instance
+
+    async def do(self, key: str, func: Callable[[], Awaitable[_T]], cancellable: Gio.Cancellable | None = None) -> _T:
+        """
+        Run a call unless an identical one is in flight, in which case its result is awaited.
+
+        The shared call runs with the context of the caller that started it. If it gets cancelled,
+        callers that weren't cancelled themselves run the call again.
+
+        Args:
+            key: Key identifying identical calls.
+            func: The call.
+            cancellable: Cancellable of the caller, to stop awaiting a shared call.
+
+        Returns:
+            The result of the call.
+        """
+        while True:
+            flight = self._flights.get(key)
+
+            if flight is None:
+                return await self._run(key, func)
+
+            self.coalesced += 1
+            logging.debug(f"Coalescing call {key}, {self.stats()}")
+
+            try:
+                return await self._wait(flight, cancellable)
+            except RequestCancelled:
+                if cancellable is not None and cancellable.is_cancelled():
+                    raise
+
+            self.retried += 1
+
+    async def _run(self, key: str, func: Callable[[], Awaitable[_T]]) -> _T:
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self.calls += 1
+
+        try:
+            result = await func()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                flight.set_exception(RequestCancelled("Shared call was cancelled"))
+            else:
+                flight.set_exception(exc)
+            flight.exception()  # Don't report it as never retrieved if there are no waiters
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+
+    @staticmethod
+    async def _wait(flight: asyncio.Future, cancellable: Gio.Cancellable | None) -> Any:
+        # Shielded so a cancelled waiter doesn't cancel the shared call
+        return await await_cancellable(asyncio.shield(flight), cancellable)
+
+    def stats(self) -> dict[str, int]:
+        """Get the coalescing counters."""
+        return {"calls": self.calls, "coalesced": self.coalesced, "retried": self.retried}
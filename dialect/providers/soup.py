@@ -2,33 +2,95 @@
 # Copyright 2022 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import json
+import hashlib
 import logging
+import time
 from asyncio import sleep
-from typing import Any
-
-from gi.repository import GLib, Soup
-
-from dialect.providers.base import BaseProvider
-from dialect.providers.errors import RequestError
+from contextlib import aclosing
+from typing import Any, AsyncGenerator
+
+from gi.repository import Gio, GLib, Soup
+
+from dialect.providers import jsonlib
+from dialect.providers.base import BaseProvider, current_cancellable
+from dialect.providers.cache import HTTP_CACHE_FRESHNESS, DiskCache
+from dialect.providers.errors import RequestCancelled, RequestError, ResponseTooLarge
+from dialect.providers.metrics import NetworkMetrics
+from dialect.providers.ratelimit import RateLimit, RateLimiter
+from dialect.providers.retry import RetryBudget, RetryPolicy, parse_retry_after
 from dialect.session import Session
 
+STREAM_CHUNK_SIZE = 64 * 1024
+""" Bytes read at once from response bodies """
+
 
 class SoupProvider(BaseProvider):
     """Base class for providers needing libsoup helpers"""
 
+    max_conns = 10
+    """ Max number of open connections of the provider session """
+    max_conns_per_host = 6
+    """ Max number of open connections to a single host of the provider session """
+    idle_timeout = 60
+    """ Seconds an idle kept-alive connection of the provider session stays open """
+    rate_limit = RateLimit()
+    """ Client-side limits of the requests sent by ``SoupProvider.send_and_read_and_process`` """
+    retry_policy = RetryPolicy()
+    """ How failed requests are retried by ``SoupProvider.send_and_read_and_process`` """
+    max_body_size = 32 * 1024 * 1024
+    """ Max bytes of a response body, bigger responses are aborted """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.retry_errors: tuple[int] = tuple()
-        """ Error codes that should be retried automatically """
-        self.max_retries = 5
-        """ Max number of tries """
+        self._session: Session | None = None
+
+    @property
+    def session(self) -> Session:
+        """
+        Soup session of the provider instance, created on first use.
+
+        Each provider instance has its own connection pool, so slow requests from an instance, like TTS
+        downloads, can't starve the connections of another.
+        """
+        if self._session is None:
+            self._session = Session.new(self.max_conns, self.max_conns_per_host, self.idle_timeout)
+        return self._session
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by the instances of the provider."""
+        return RateLimiter.get(self.name, self.rate_limit)
+
+    @property
+    def prewarm_url(self) -> str | None:
+        """Url whose host ``SoupProvider.prewarm`` connects to, defaults to ``translate_url`` if defined."""
+        return getattr(self, "translate_url", None)
+
+    async def prewarm(self) -> None:
+        """
+        Open a connection to the provider host, resolving DNS and doing the TLS handshake.
+
+        The connection is kept alive in the provider session for the first request.
+        """
+        try:
+            url = self.prewarm_url
+            if not url:
+                return
+
+            start = time.monotonic()
+            message = self.create_message("HEAD", url)
+            await self.session.preconnect_async(message, GLib.PRIORITY_DEFAULT, None)  # type: ignore
+            logging.debug(f"Prewarmed {self.name} connection in {(time.monotonic() - start) * 1000:.0f} ms")
+        except Exception as exc:
+            logging.debug(f"Failed prewarming {self.name} connection: {exc}")
 
     def encode_data(self, data: Any) -> GLib.Bytes | None:
         """
         Convert Python data to JSON and bytes.
 
+        Uses the fastest JSON library available, see ``jsonlib``.
+
         Args:
             data: Data to encode, anything json.dumps can handle.
 
@@ -37,8 +99,7 @@ class SoupProvider(BaseProvider):
         """
         data_glib_bytes = None
         try:
-            data_bytes = json.dumps(data).encode("utf-8")
-            data_glib_bytes = GLib.Bytes.new(data_bytes)
+            data_glib_bytes = GLib.Bytes.new(jsonlib.dumps(data))
         except Exception as exc:
             logging.warning(exc)
         return data_glib_bytes
@@ -80,31 +141,111 @@ class SoupProvider(BaseProvider):
 
         return message  # type: ignore
 
-    async def send_and_read(self, message: Soup.Message) -> bytes | None:
+    async def send_and_stream(
+        self,
+        message: Soup.Message,
+        cancellable: Gio.Cancellable | None = None,
+        max_size: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncGenerator[bytes, None]:
         """
-        Helper method for Soup's send_and_read_async.
+        Helper method for Soup's send_async, reading the response body in chunks.
+
+        Stopping the iteration aborts the rest of the download. Wrap the iterator with
+        ``contextlib.aclosing`` so the response is released as soon as the loop is left.
 
         Args:
             message: Message to send.
+            cancellable: Cancellable to abort the request, defaults to the one of the ongoing translation.
+            max_size: Max bytes of the body, defaults to ``SoupProvider.max_body_size``, 0 for no limit.
+            chunk_size: Max bytes of each chunk.
+
+        Yields:
+            The bytes of the response body as they are received.
+
+        Raises:
+            ResponseTooLarge: If the body exceeds ``max_size``.
+        """
+        cancellable = cancellable or current_cancellable.get()
+        max_size = self.max_body_size if max_size is None else max_size
+
+        stream: Gio.InputStream = await self.session.send_async(message, GLib.PRIORITY_DEFAULT, cancellable)  # type: ignore
+
+        try:
+            if max_size and message.get_response_headers().get_content_length() > max_size:
+                raise ResponseTooLarge(f"Response from {self.name} is bigger than {max_size} bytes")
+
+            size = 0
+            while True:
+                chunk: GLib.Bytes = await stream.read_bytes_async(chunk_size, GLib.PRIORITY_DEFAULT, cancellable)  # type: ignore
+                data = chunk.get_data()
+                if not data:
+                    break
+
+                size += len(data)
+                if max_size and size > max_size:
+                    raise ResponseTooLarge(f"Response from {self.name} is bigger than {max_size} bytes")
+
+                yield data
+        finally:
+            await stream.close_async(GLib.PRIORITY_DEFAULT, None)  # type: ignore
+
+    async def send_and_read(self, message: Soup.Message, cancellable: Gio.Cancellable | None = None) -> bytearray:
+        """
+        Helper method for Soup's send_async, reading the whole response body.
+
+        Chunks are appended to a single buffer as they are received, so the body is copied once.
+
+        Args:
+            message: Message to send.
+            cancellable: Cancellable to abort the request, defaults to the one of the ongoing translation.
 
         Returns:
-            The bytes of the response or None.
+            The bytes of the response.
+
+        Raises:
+            ResponseTooLarge: If the body exceeds ``SoupProvider.max_body_size``.
         """
-        response: GLib.Bytes = await Session.get().send_and_read_async(message, 0)  # type: ignore
-        return response.get_data()
+        body = bytearray()
+        async with aclosing(self.send_and_stream(message, cancellable)) as chunks:
+            async for chunk in chunks:
+                body += chunk
+        return body
 
-    async def send_and_read_json(self, message: Soup.Message) -> Any:
+    async def send_and_read_json(self, message: Soup.Message, cancellable: Gio.Cancellable | None = None) -> Any:
         """
         Like ``SoupProvider.send_and_read`` but returns JSON parsed.
 
+        The response bytes are parsed as they are, without decoding them to a string first.
+
         Args:
             message: Message to send.
+            cancellable: Cancellable to abort the request.
 
         Returns:
             The JSON of the response deserialized to a python object.
         """
-        response = await self.send_and_read(message)
-        return json.loads(response) if response else {}
+        response = await self.send_and_read(message, cancellable)
+        return jsonlib.loads(response) if response else {}
+
+    @staticmethod
+    def count_chars(data: Any) -> int:
+        """
+        Count the characters of the strings in request data.
+
+        Args:
+            data: Request body or form data.
+
+        Returns:
+            The sum of the length of the strings in data.
+        """
+        if isinstance(data, str):
+            return len(data)
+        if isinstance(data, dict):
+            return sum(SoupProvider.count_chars(value) for value in data.values())
+        if isinstance(data, (list, tuple)):
+            return sum(SoupProvider.count_chars(value) for value in data)
+        return 0
 
     def check_known_errors(self, status: Soup.Status, data: Any) -> None:
         """
@@ -122,52 +263,119 @@ class SoupProvider(BaseProvider):
         message: Soup.Message,
         check_common: bool = True,
         return_json: bool = True,
+        cancellable: Gio.Cancellable | None = None,
+        chars: int = 0,
     ) -> Any:
         """
         Helper mixing ``SoupProvider.send_and_read``, ``SoupProvider.send_and_read_json``
         and ``SoupProvider.check_known_errors``.
 
-        Converts `GLib.Error` to `RequestError`.
+        Converts `GLib.Error` to `RequestError`, or `RequestCancelled` if the request was cancelled.
+
+        It also handles retries according to ``SoupProvider.retry_policy``, honoring Retry-After headers,
+        within the process-wide ``RetryBudget``, and records the request in ``NetworkMetrics``.
 
-        It also handles retries for status codes listen in ``self.retry_errors``.
+        Every attempt waits its turn according to ``SoupProvider.rate_limit``, attempts that fail
+        before sending anything don't count against it. Attempts go through ``self.circuit_breaker``,
+        transport errors and 5xx or 429 statuses count as failures.
 
         Args:
             message: Message to send.
             check_common: If response data should be checked for errors using check_known_errors.
             return_json: If the response should be parsed as JSON.
+            cancellable: Cancellable to abort the request, defaults to the one of the ongoing translation.
+            chars: Number of characters the request sends, for ``RateLimit.chars_per_minute``.
 
         Returns:
             The JSON deserialized to a python object or bytes if ``json`` is ``False``.
         """
+        cancellable = cancellable or current_cancellable.get()
 
         async def send_and_read() -> Any:
             if return_json:
-                return await self.send_and_read_json(message)
+                return await self.send_and_read_json(message, cancellable)
             else:
-                return await self.send_and_read(message)
+                return await self.send_and_read(message, cancellable)
+
+        policy = self.retry_policy
+        budget = RetryBudget.get()
+        metrics = NetworkMetrics.get()
+        limiter = self.rate_limiter
+        breaker = self.circuit_breaker
+        method = message.get_method()
+        start = time.monotonic()
+        deadline = start + policy.deadline
+        delay = policy.base_delay
+        retries = 0
+        sent = False
+
+        def on_wrote_headers(_message: Soup.Message):
+            nonlocal sent
+            sent = True
+
+        budget.record_request()
+        metrics.prepare(message)
+        handler = message.connect("wrote-headers", on_wrote_headers)
 
         try:
-            response = await send_and_read()
-
-            # Do retries with exponential backoff for errors
-            if message.get_status() in self.retry_errors:
-                delay = 1
-
-                for _ in range(self.max_retries):
-                    await sleep(delay)
-                    response = await send_and_read()
-
-                    if message.get_status() in self.retry_errors:
-                        delay *= 2
-                    else:
-                        break
-
-            if check_common:
-                self.check_known_errors(message.get_status(), response)
-
-            return response
-        except GLib.Error as exc:
-            raise RequestError(exc.message)
+            while True:
+                error: GLib.Error | None = None
+                retry_after = None
+                sent = False
+
+                probe = breaker.check()
+                try:
+                    async with limiter.acquire(chars, cancellable):
+                        attempt_start = time.monotonic()
+                        try:
+                            response = await send_and_read()
+                        except GLib.Error as exc:
+                            if not sent:
+                                limiter.refund(chars)
+
+                            if exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                                raise RequestCancelled(exc.message)
+
+                            breaker.record(False)
+                            error = exc
+                            retry = policy.transport_errors and policy.is_idempotent(method)
+                        else:
+                            status = message.get_status()
+                            breaker.record(status < 500 and status != 429, time.monotonic() - attempt_start)
+
+                            retry = policy.should_retry_status(status, method)
+                            if retry:
+                                retry_after = parse_retry_after(message.get_response_headers().get_one("Retry-After"))
+                except BaseException:
+                    breaker.discard(probe)
+                    raise
+
+                if retry and retries < policy.max_retries:
+                    delay = policy.next_delay(delay, retry_after)
+
+                    # Give up if waiting would exceed the deadline or the retries budget is exhausted
+                    if time.monotonic() + delay < deadline and budget.try_retry():
+                        retries += 1
+                        logging.debug(f"Retrying {method} request to {self.name} in {delay:.1f}s")
+
+                        await sleep(delay)
+                        if cancellable and cancellable.is_cancelled():
+                            raise RequestCancelled("Request was cancelled")
+
+                        continue
+
+                if error is not None:
+                    raise RequestError(error.message)
+
+                break
+        finally:
+            message.disconnect(handler)
+            metrics.record(message, self.name, retries, time.monotonic() - start)
+
+        if check_common:
+            self.check_known_errors(message.get_status(), response)
+
+        return response
 
     async def request(
         self,
@@ -178,10 +386,13 @@ class SoupProvider(BaseProvider):
         form: bool = False,
         check_common: bool = True,
         return_json: bool = True,
+        cancellable: Gio.Cancellable | None = None,
     ) -> Any:
         """
         Helper for regular HTTP request.
 
+        Requests wait their turn according to ``SoupProvider.rate_limit``.
+
         Args:
             method: HTTP method of the request.
             url: Url of the request.
@@ -190,12 +401,48 @@ class SoupProvider(BaseProvider):
             form: If the data should be encoded as a form.
             check_common: If response data should be checked for errors using check_known_errors.
             return_json: If the response should be parsed as JSON.
+            cancellable: Cancellable to abort the request.
 
         Returns:
             The JSON deserialized to a python object or bytes if ``json`` is ``False``.
         """
         message = self.create_message(method, url, data, headers, form)
-        return await self.send_and_read_and_process(message, check_common, return_json)
+        return await self.send_and_read_and_process(
+            message, check_common, return_json, cancellable, self.count_chars(data)
+        )
+
+    async def stream(
+        self,
+        url: str,
+        headers: dict = {},
+        max_size: int | None = None,
+        cancellable: Gio.Cancellable | None = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Helper for GET HTTP requests whose response is consumed incrementally.
+
+        Meant for big responses, like HTML pages, where only part of the body is needed or where keeping
+        the whole body in memory is wasteful. Responses aren't retried nor checked for errors.
+
+        Args:
+            url: Url of the request.
+            headers: HTTP headers of the message.
+            max_size: Max bytes of the body, defaults to ``SoupProvider.max_body_size``, 0 for no limit.
+            cancellable: Cancellable to abort the request.
+
+        Yields:
+            The bytes of the response body as they are received.
+        """
+        message = self.create_message("GET", url, headers=headers)
+        async with self.rate_limiter.acquire(cancellable=cancellable or current_cancellable.get()):
+            try:
+                async with aclosing(self.send_and_stream(message, cancellable, max_size)) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+            except GLib.Error as exc:
+                if exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    raise RequestCancelled(exc.message)
+                raise RequestError(exc.message)
 
     async def get(
         self,
@@ -203,6 +450,8 @@ class SoupProvider(BaseProvider):
         headers: dict = {},
         check_common: bool = True,
         return_json: bool = True,
+        cancellable: Gio.Cancellable | None = None,
+        cache: bool = False,
     ) -> Any:
         """
         Helper for GET HTTP request.
@@ -212,11 +461,68 @@ class SoupProvider(BaseProvider):
             headers: HTTP headers of the message.
             check_common: If response data should be checked for errors using check_known_errors.
             return_json: If the response should be parsed as JSON.
+            cancellable: Cancellable to abort the request.
+            cache: If the response can be cached, meant for metadata like languages lists.
 
         Returns:
             The JSON deserialized to a python object or bytes if ``json`` is ``False``.
         """
-        return await self.request("GET", url, headers=headers, check_common=check_common, return_json=return_json)
+        if cache:
+            return await self.get_cached(url, headers, check_common, return_json, cancellable)
+
+        return await self.request(
+            "GET", url, headers=headers, check_common=check_common, return_json=return_json, cancellable=cancellable
+        )
+
+    async def get_cached(
+        self,
+        url: str,
+        headers: dict = {},
+        check_common: bool = True,
+        return_json: bool = True,
+        cancellable: Gio.Cancellable | None = None,
+    ) -> Any:
+        """
+        Like ``SoupProvider.get`` but using the responses stored in ``DiskCache``.
+
+        Stored responses are used as they are for ``HTTP_CACHE_FRESHNESS`` seconds, then revalidated
+        with their ETag or Last-Modified headers. Only successful responses are stored.
+        """
+        disk = DiskCache.get()
+        authorization = headers.get("Authorization", "")
+        key = "GET:" + hashlib.blake2b(f"{url}\n{authorization}".encode(), digest_size=16).hexdigest()
+        cached = await disk.lookup_response(key)
+        status = Soup.Status.OK
+
+        if cached is not None and cached.age < HTTP_CACHE_FRESHNESS:
+            response = cached.body
+        else:
+            message = self.create_message("GET", url, headers=headers)
+            if cached is not None:
+                if cached.etag:
+                    message.get_request_headers().append("If-None-Match", cached.etag)
+                if cached.last_modified:
+                    message.get_request_headers().append("If-Modified-Since", cached.last_modified)
+
+            response = await self.send_and_read_and_process(message, False, False, cancellable)
+
+            status = message.get_status()
+            if status == Soup.Status.NOT_MODIFIED and cached is not None:
+                disk.refresh_response(key)
+                response, status = cached.body, Soup.Status.OK
+            elif status == Soup.Status.OK and response is not None:
+                response_headers = message.get_response_headers()
+                disk.store_response(
+                    key, response, response_headers.get_one("ETag"), response_headers.get_one("Last-Modified")
+                )
+
+        if return_json:
+            response = jsonlib.loads(response) if response else {}
+
+        if check_common:
+            self.check_known_errors(status, response)
+
+        return response
 
     async def post(
         self,
@@ -226,6 +532,7 @@ class SoupProvider(BaseProvider):
         form: bool = False,
         check_common: bool = True,
         return_json: bool = True,
+        cancellable: Gio.Cancellable | None = None,
     ) -> Any:
         """
         Helper for POST HTTP request.
@@ -237,8 +544,9 @@ class SoupProvider(BaseProvider):
             form: If the data should be encoded as a form.
             check_common: If response data should be checked for errors using check_known_errors.
             return_json: If the response should be parsed as JSON.
+            cancellable: Cancellable to abort the request.
 
         Returns:
             The JSON deserialized to a python object or bytes if ``json`` is ``False``.
         """
-        return await self.request("POST", url, data, headers, form, check_common, return_json)
+        return await self.request("POST", url, data, headers, form, check_common, return_json, cancellable)
@@ -0,0 +1,122 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import logging
+import os
+from typing import Callable
+
+from gi.repository import GLib
+
+FLUSH_CHARS = ".!?;。！？；…\n"
+""" Trailing chars that trigger an immediate translation """
+
+
+class LiveTranslationScheduler:
+    """
+    Debounces live translation requests while the user is typing.
+
+    A translation is dispatched once the text stays unchanged for ``delay`` ms, or
+    after ``max_wait`` ms of continuous typing if the text changed at least
+    ``min_chars`` chars or ``min_words`` words since the last dispatch.
+    Texts ending with punctuation or a new line are dispatched immediately.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        delay: int = 400,
+        max_wait: int = 2000,
+        min_chars: int = 3,
+        min_words: int = 1,
+    ):
+        self.callback = callback
+        """ Function dispatching the translation """
+        self.delay = delay
+        """ Idle time in ms before dispatching """
+        self.max_wait = max_wait
+        """ Max time in ms a change can wait while the user keeps typing """
+        self.min_chars = min_chars
+        """ Min number of changed chars for a forced dispatch """
+        self.min_words = min_words
+        """ Min number of changed words for a forced dispatch """
+
+        self.dispatched = 0
+        """ Number of dispatched translations """
+        self.suppressed = 0
+        """ Number of changes that didn't produce a translation of their own """
+
+        self._last_text = ""
+        self._pending_text: str | None = None
+        self._pending_count = 0
+        self._idle_id = 0
+        self._max_wait_id = 0
+
+    def schedule(self, text: str) -> None:
+        """
+        Register a change of the text to translate.
+
+        Args:
+            text: The current text.
+        """
+        self._pending_text = text
+        self._pending_count += 1
+
+        if not text.strip() or text[-1] in FLUSH_CHARS:
+            self.flush()
+            return
+
+        # Restart the idle timeout
+        if self._idle_id:
+            GLib.source_remove(self._idle_id)
+        self._idle_id = GLib.timeout_add(self.delay, self._on_idle_timeout)
+
+        if not self._max_wait_id:
+            self._max_wait_id = GLib.timeout_add(self.max_wait, self._on_max_wait_timeout)
+
+    def flush(self) -> None:
+        """Dispatch the pending change now."""
+        self._remove_timeouts()
+
+        if self._pending_text is None:
+            return
+
+        self.suppressed += self._pending_count - 1
+        self.dispatched += 1
+        self._last_text = self._pending_text
+        self._pending_text = None
+        self._pending_count = 0
+
+        logging.debug(f"Live translation dispatched, {self.suppressed} of {self.total} changes suppressed so far")
+        self.callback()
+
+    @property
+    def total(self) -> int:
+        """Number of changes registered."""
+        return self.dispatched + self.suppressed + self._pending_count
+
+    def _changed_enough(self, text: str) -> bool:
+        prefix = len(os.path.commonprefix([text, self._last_text]))
+        chars = max(len(text), len(self._last_text)) - prefix
+        words = abs(len(text.split()) - len(self._last_text.split()))
+        return chars >= self.min_chars or words >= self.min_words
+
+    def _remove_timeouts(self) -> None:
+        if self._idle_id:
+            GLib.source_remove(self._idle_id)
+            self._idle_id = 0
+        if self._max_wait_id:
+            GLib.source_remove(self._max_wait_id)
+            self._max_wait_id = 0
+
+    def _on_idle_timeout(self) -> bool:
+        self._idle_id = 0
+        self.flush()
+        return GLib.SOURCE_REMOVE
+
+    def _on_max_wait_timeout(self) -> bool:
+        self._max_wait_id = 0
+
+        if self._pending_text is not None and self._changed_enough(self._pending_text):
+            self.flush()
+
+        return GLib.SOURCE_REMOVE
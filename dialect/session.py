@@ -12,25 +12,24 @@ class Session(Soup.Session):
     Dialect soup session handler
     """
 
-    instance = None
     errors = {}
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
     @staticmethod
-    def new() -> Session:
-        """Create a new instance of Session."""
-        s_session = Session()
+    def new(max_conns: int = 10, max_conns_per_host: int = 2, idle_timeout: int = 60) -> Session:
+        """
+        Create a new instance of Session.
+
+        Args:
+            max_conns: Max number of open connections.
+            max_conns_per_host: Max number of open connections to a single host.
+            idle_timeout: Seconds an idle kept-alive connection stays open.
+        """
+        s_session = Session(max_conns=max_conns, max_conns_per_host=max_conns_per_host, idle_timeout=idle_timeout)
         return s_session
 
-    @staticmethod
-    def get() -> Session:
-        """Return an active instance of Session."""
-        if Session.instance is None:
-            Session.instance = Session.new()
-        return Session.instance
-
     @staticmethod
     def get_response(session: Session, result: Gio.AsyncResult):
         try:
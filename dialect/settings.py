@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Literal
 
 from gi.repository import Gio, GLib, GObject
 
 from dialect.define import APP_ID
 from dialect.providers import (
+    TRANSLATORS,
     TTS,
     check_translator_availability,
     get_fallback_translator_name,
@@ -69,6 +71,30 @@ class Settings(Gio.Settings):
         self._translators.set_string("active", translator)
         self.emit("provider-changed::translator", "translator", translator)
 
+    @property
+    def fallback_translators(self) -> list[str]:
+        """Return the available fallback translators, excluding the active one."""
+        active = self.active_translator
+        translators = []
+        for name in self._translators.get_strv("fallbacks"):
+            if name not in TRANSLATORS:
+                logging.warning(f"Unknown or unavailable fallback translator {name}, ignoring it")
+            elif name != active:
+                translators.append(name)
+        return translators
+
+    @fallback_translators.setter
+    def fallback_translators(self, translators: list[str]):
+        self._translators.set_strv("fallbacks", translators)
+
+    @property
+    def hedging(self) -> bool:
+        return self._translators.get_boolean("hedging")
+
+    @property
+    def hedging_percentile(self) -> int:
+        return self._translators.get_int("hedging-percentile")
+
     @property
     def window_size(self) -> tuple[int, int]:
         value = self.get_value("window-size")
@@ -158,6 +184,22 @@ class Settings(Gio.Settings):
     def live_translation(self, state: bool):
         self.set_boolean("live-translation", state)
 
+    @property
+    def live_translation_delay(self) -> int:
+        return self.get_int("live-translation-delay")
+
+    @property
+    def live_translation_max_wait(self) -> int:
+        return self.get_int("live-translation-max-wait")
+
+    @property
+    def live_translation_min_chars(self) -> int:
+        return self.get_int("live-translation-min-chars")
+
+    @property
+    def live_translation_min_words(self) -> int:
+        return self.get_int("live-translation-min-words")
+
     @property
     def sp_translation(self) -> bool:
         return self.get_boolean("sp-translation")
@@ -166,6 +208,14 @@ class Settings(Gio.Settings):
     def sp_translation(self, state: bool):
         self.set_boolean("sp-translation", state)
 
+    @property
+    def save_translations(self) -> bool:
+        return self.get_boolean("save-translations")
+
+    @save_translations.setter
+    def save_translations(self, state: bool):
+        self.set_boolean("save-translations", state)
+
     @property
     def show_pronunciation(self) -> bool:
         return self.get_boolean("show-pronunciation")
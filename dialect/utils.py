@@ -2,8 +2,10 @@
 # Copyright 2024 Rafael Mardojai CM
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from typing import Iterable
 
-def find_item_match(list1: list[str], list2: list[str]) -> str | None:
+
+def find_item_match(list1: Iterable[str], list2: Iterable[str]) -> str | None:
     """
     Get the first occurrence in two lists.
 
@@ -15,7 +17,7 @@ def find_item_match(list1: list[str], list2: list[str]) -> str | None:
     return next((i for i in list1 if i in set_to_check), None)
 
 
-def first_exclude(list_: list[str], exclude: str) -> str | None:
+def first_exclude(list_: Iterable[str], exclude: str) -> str | None:
     """
     Get the first item that is not excluded.
 
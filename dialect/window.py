@@ -6,7 +6,7 @@
 
 import logging
 import re
-from typing import Literal, TypedDict
+from typing import Iterator, Literal, TypedDict
 
 from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gst, Gtk, Spelling
 
@@ -14,16 +14,21 @@ from dialect.asyncio import background_task
 from dialect.define import APP_ID, PROFILE, RES_PATH, TRANS_NUMBER
 from dialect.languages import LanguagesListModel
 from dialect.providers import (
+    STATE_TTL,
     TRANSLATORS,
     TTS,
     APIKeyInvalid,
     APIKeyRequired,
     BaseProvider,
     ProviderError,
+    RequestCancelled,
     RequestError,
     Translation,
     TranslationRequest,
+    UnexpectedError,
 )
+from dialect.providers.hedging import Hedger
+from dialect.scheduler import LiveTranslationScheduler
 from dialect.settings import Settings
 from dialect.shortcuts import DialectShortcutsWindow
 from dialect.utils import find_item_match, first_exclude
@@ -94,6 +99,7 @@ class DialectWindow(Adw.ApplicationWindow):
 
     # Providers objects
     provider: dict[str, BaseProvider | None] = {"trans": None, "tts": None}
+    fallback_providers: list[BaseProvider] = []  # used when the translator fails
 
     # Text to speech
     speech_provider_failed = False  # tts provider loading failed
@@ -108,7 +114,8 @@ class DialectWindow(Adw.ApplicationWindow):
 
     # Translation-related variables
     selection_translation_langs: tuple[str | None, str | None] = (None, None)
-    next_translation: TranslationRequest | None = None  # for ongoing translation
+    translation_cancellable: Gio.Cancellable | None = None  # for aborting the ongoing translation
+    translation_serial = 0  # for dropping outdated translations
     translation_loading = False  # for ongoing translation
 
     # Suggestions
@@ -295,6 +302,18 @@ class DialectWindow(Adw.ApplicationWindow):
         self.trans_spinner.hide()
         self.trans_warning.hide()
 
+        # Live translation debouncing
+        self.live_scheduler = LiveTranslationScheduler(self._on_translation)
+        self._update_live_scheduler()
+        for key in ("delay", "max-wait", "min-chars", "min-words"):
+            Settings.get().connect(f"changed::live-translation-{key}", self._update_live_scheduler)
+
+    def _update_live_scheduler(self, *_args):
+        self.live_scheduler.delay = Settings.get().live_translation_delay
+        self.live_scheduler.max_wait = Settings.get().live_translation_max_wait
+        self.live_scheduler.min_chars = Settings.get().live_translation_min_chars
+        self.live_scheduler.min_words = Settings.get().live_translation_min_words
+
     def reload_provider(self, kind: str):
         match kind:
             case "translator":
@@ -324,9 +343,19 @@ class DialectWindow(Adw.ApplicationWindow):
             "changed::api-key", self._on_provider_changed, self.provider["trans"].name
         )
 
+        # Open the provider connection while it loads
+        self._prewarm_provider(self.provider["trans"])
+        # Get fallback providers ready
+        self.load_fallbacks()
+
         try:
-            # Do provider init
-            await self.provider["trans"].init_trans()
+            # Restore cached provider init, or do it
+            state_age = await self.provider["trans"].restore_state("trans")
+            if state_age is None:
+                await self.provider["trans"].init_trans()
+                self.provider["trans"].save_state("trans")
+            elif state_age > STATE_TTL:
+                self._revalidate_translator(self.provider["trans"])
 
             # Update navigation UI
             self._check_navigation_enabled()
@@ -355,7 +384,7 @@ class DialectWindow(Adw.ApplicationWindow):
             self.dest_lang_selector.selected = dest_lang
 
             # Update chars limit
-            if self.provider["trans"].chars_limit == -1:  # -1 means unlimited
+            if self.provider["trans"].chars_limit <= 0:  # -1 means unlimited
                 self.char_counter.props.label = ""
             else:
                 count = f"{str(self.src_buffer.get_char_count())}/{self.provider['trans'].chars_limit}"
@@ -420,6 +449,44 @@ class DialectWindow(Adw.ApplicationWindow):
         finally:
             self.translator_loading = False
 
+    @background_task
+    async def _prewarm_provider(self, provider: BaseProvider):
+        await provider.prewarm()
+
+    @background_task
+    async def load_fallbacks(self):
+        providers = []
+
+        for name in Settings.get().fallback_translators:
+            provider = TRANSLATORS[name]()
+
+            try:
+                if await provider.restore_state("trans") is None:
+                    await provider.init_trans()
+                    provider.save_state("trans")
+                await provider.prewarm()
+            except (RequestError, ProviderError) as exc:
+                logging.warning(f"Failed loading {name} fallback translator: {exc}")
+                continue
+
+            providers.append(provider)
+
+        self.fallback_providers = providers
+
+    @background_task
+    async def _revalidate_translator(self, provider: BaseProvider):
+        try:
+            changed = await provider.revalidate_state("trans")
+        except (RequestError, ProviderError) as exc:
+            logging.warning(f"Failed revalidating {provider.name} provider: {exc}")
+            return
+
+        # Update langs if the provider is still active
+        if changed and provider is self.provider["trans"] and not self.translator_loading:
+            self.src_lang_model.set_langs(provider.src_languages)
+            self.dest_lang_model.set_langs(provider.dest_languages)
+            self._check_switch_enabled()
+
     def show_translator_error_view(
         self,
         title: str = _("Failed loading the translation service"),
@@ -480,8 +547,13 @@ class DialectWindow(Adw.ApplicationWindow):
             )
 
             try:
-                # Do TTS init
-                await self.provider["tts"].init_tts()
+                # Restore cached TTS init, or do it
+                state_age = await self.provider["tts"].restore_state("tts")
+                if state_age is None:
+                    await self.provider["tts"].init_tts()
+                    self.provider["tts"].save_state("tts")
+                elif state_age > STATE_TTL:
+                    self._revalidate_tts(self.provider["tts"])
 
                 self.speech_provider_failed = False
                 self.src_speech_btn.ready()
@@ -508,6 +580,14 @@ class DialectWindow(Adw.ApplicationWindow):
             self.src_speech_btn.props.visible = False
             self.dest_speech_btn.props.visible = False
 
+    @background_task
+    async def _revalidate_tts(self, provider: BaseProvider):
+        try:
+            if await provider.revalidate_state("tts") and provider is self.provider["tts"]:
+                self._check_speech_enabled()
+        except (RequestError, ProviderError) as exc:
+            logging.warning(f"Failed revalidating {provider.name} provider: {exc}")
+
     def translate(self, text: str, src_lang: str | None, dest_lang: str | None):
         """
         Translates the given text from auto detected or last used src language to
@@ -965,17 +1045,12 @@ class DialectWindow(Adw.ApplicationWindow):
 
         char_count = buffer.get_char_count()
 
-        # If the text is over the highest number of characters allowed, it is truncated.
-        # This is done for avoiding exceeding the limit imposed by translation services.
-        if self.provider["trans"].chars_limit == -1:  # -1 means unlimited
+        # Texts over the characters limit are segmented by the provider, so the text is not truncated
+        if self.provider["trans"].chars_limit <= 0:  # -1 means unlimited
             self.char_counter.props.label = ""
         else:
             self.char_counter.props.label = f"{str(char_count)}/{self.provider['trans'].chars_limit}"
 
-            if char_count >= self.provider["trans"].chars_limit:
-                self.send_notification(_("{} characters limit reached!").format(self.provider["trans"].chars_limit))
-                buffer.delete(buffer.get_iter_at_offset(self.provider["trans"].chars_limit), buffer.get_end_iter())
-
         sensitive = char_count != 0
         self.lookup_action("translation").props.enabled = sensitive  # type: ignore
         self.lookup_action("clear").props.enabled = sensitive  # type: ignore
@@ -992,9 +1067,10 @@ class DialectWindow(Adw.ApplicationWindow):
         )
         self._check_speech_enabled()
 
-    def _on_user_action_ended(self, _buffer):
+    def _on_user_action_ended(self, buffer: Gtk.TextBuffer):
         if Settings.get().live_translation:
-            self._on_translation()
+            text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), True)
+            self.live_scheduler.schedule(text)
 
     @Gtk.Template.Callback()
     def _on_is_active_changed(self, *_args):
@@ -1134,6 +1210,41 @@ class DialectWindow(Adw.ApplicationWindow):
 
         return Gdk.EVENT_STOP
 
+    async def _translate_with_fallbacks(self, request: TranslationRequest, cancellable: Gio.Cancellable) -> Translation:
+        """Translate with the active translator, failing over to the fallback ones"""
+        provider: BaseProvider = self.provider["trans"]  # type: ignore
+
+        try:
+            # Hedge slow translations with the first available fallback
+            if Settings.get().hedging and (secondary := next(self._usable_fallbacks(request), None)):
+                return await Hedger.get().translate(
+                    provider, secondary, request, Settings.get().hedging_percentile, cancellable
+                )
+
+            return await provider.translate(request, cancellable)
+        except RequestCancelled:
+            raise
+        except (RequestError, UnexpectedError) as exc:
+            for fallback in self._usable_fallbacks(request):
+                try:
+                    translation = await fallback.translate(request, cancellable)
+                except RequestCancelled:
+                    raise
+                except (RequestError, ProviderError) as fallback_exc:
+                    logging.warning(f"Fallback translator {fallback.name} failed: {fallback_exc}")
+                    continue
+
+                logging.info(f"Translated with fallback translator {fallback.name}, {exc}")
+                return translation
+
+            raise
+
+    def _usable_fallbacks(self, request: TranslationRequest) -> Iterator[BaseProvider]:
+        """Get the healthy fallback translators supporting the request"""
+        for fallback in self.fallback_providers:
+            if fallback.circuit_breaker.allows_requests and fallback.supports_pair(request.src, request.dest):
+                yield fallback
+
     @Gtk.Template.Callback()
     @background_task
     async def _on_translation(self, *_args):
@@ -1141,17 +1252,17 @@ class DialectWindow(Adw.ApplicationWindow):
             # If it's like the last translation then it's useless to continue
             return
 
-        # Run translation
-        if self.next_translation:
-            request = self.next_translation
-            self.next_translation = None
-        else:
-            text = self.src_buffer.get_text(self.src_buffer.get_start_iter(), self.src_buffer.get_end_iter(), True)
-            request = TranslationRequest(text, self.src_lang_selector.selected, self.dest_lang_selector.selected)
+        text = self.src_buffer.get_text(self.src_buffer.get_start_iter(), self.src_buffer.get_end_iter(), True)
+        request = TranslationRequest(text, self.src_lang_selector.selected, self.dest_lang_selector.selected)
 
-            if self.translation_loading:
-                self.next_translation = request
-                return
+        # Abort the ongoing translation, this request supersedes it
+        if self.translation_cancellable:
+            self.translation_cancellable.cancel()
+
+        self.translation_serial += 1
+        serial = self.translation_serial
+        cancellable = Gio.Cancellable()
+        self.translation_cancellable = cancellable
 
         # Show feedback for start of translation.
         self.trans_spinner.show()
@@ -1163,7 +1274,11 @@ class DialectWindow(Adw.ApplicationWindow):
             self.translation_loading = True
 
             try:
-                translation = await self.provider["trans"].translate(request)
+                translation = await self._translate_with_fallbacks(request, cancellable)
+
+                # Drop responses arriving after a newer translation started
+                if serial != self.translation_serial:
+                    return
 
                 if translation.detected and self.src_lang_selector.selected == "auto":
                     if Settings.get().src_auto:
@@ -1182,8 +1297,15 @@ class DialectWindow(Adw.ApplicationWindow):
                 self._check_mistakes()
                 self._check_pronunciation()
 
+            # Translation superseded
+            except RequestCancelled:
+                return
+
             # Translation failed
             except (RequestError, ProviderError) as exc:
+                if serial != self.translation_serial:
+                    return
+
                 self.trans_warning.props.visible = True
                 self.lookup_action("copy").props.enabled = False  # type: ignore
                 self.lookup_action("listen-src").props.enabled = False  # type: ignore
@@ -1226,18 +1348,17 @@ class DialectWindow(Adw.ApplicationWindow):
                 self.trans_warning.props.visible = False
 
             finally:
-                self.translation_loading = False
-
-                if self.next_translation:
-                    self._on_translation()
-                else:
+                # Only the latest translation updates the loading state
+                if serial == self.translation_serial:
+                    self.translation_cancellable = None
+                    self.translation_loading = False
                     self._translation_finish()
         else:
             self.trans_mistakes = None
             self.dest_buffer.props.text = ""
-
-            if not self.translation_loading:
-                self._translation_finish()
+            self.translation_cancellable = None
+            self.translation_loading = False
+            self._translation_finish()
 
     def _appeared_before(self):
         if not self.provider["trans"]:
@@ -0,0 +1,98 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+# Load the module alone, the dialect.providers package needs gi
+_spec = importlib.util.spec_from_file_location(
+    "jsonlib", Path(__file__).parents[1] / "dialect" / "providers" / "jsonlib.py"
+)
+jsonlib = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(jsonlib)  # type: ignore
+
+RPC_ID = "MkEWBc"
+""" Same as ``dialect.providers.modules.google.RPC_ID`` """
+BATCHEXECUTE_GUARD = b")]}'"
+""" Same as ``dialect.providers.modules.google.BATCHEXECUTE_GUARD`` """
+
+TEXTS = ["hello world " * 150, "héllo wörld " * 150, "你好 🙂 " * 200, 'quote \\" ]] [[ ' * 50] + [
+    "日本" * k for k in range(1, 200)
+]
+
+
+def build_response(text: str, counts_newline: bool = True) -> bytes:
+    """Build a batchexecute response like Google's, with UTF-16 frame lengths."""
+    inner = json.dumps(
+        [[None, None, "en"], [[[text, None, None, None, None, [[text, []]]]], [None, "en", "ja", True]]],
+        ensure_ascii=False,
+    )
+    envelopes = [["wrb.fr", RPC_ID, inner, None, None, None, "generic"], ["di", 97], ["af.httprm", 96, "-1234", 1]]
+    frames = [json.dumps(envelopes, ensure_ascii=False, separators=(",", ":")), json.dumps([["e", 4, None, None, 100]])]
+
+    body = ")]}'\n"
+    for frame in frames:
+        counted = "\n" + frame if counts_newline else frame
+        body += f"\n{len(counted.encode('utf-16-le')) // 2}\n{frame}"
+    return (body + "\n").encode()
+
+
+def reference_parse(response: bytes) -> list:
+    """The previous parser, walking the response characters to find the end of the RPC frame."""
+    token_found = False
+    square_bracket_counts = [0, 0]
+    resp = ""
+
+    for line in response.decode("utf-8").split("\n"):
+        token_found = token_found or f'"{RPC_ID}"' in line[:30]
+        if not token_found:
+            continue
+
+        is_in_string = False
+        for index, char in enumerate(line):
+            if char == '"' and line[max(0, index - 1)] != "\\":
+                is_in_string = not is_in_string
+            if not is_in_string:
+                if char == "[":
+                    square_bracket_counts[0] += 1
+                elif char == "]":
+                    square_bracket_counts[1] += 1
+
+        resp += line
+        if square_bracket_counts[0] == square_bracket_counts[1]:
+            break
+
+    return json.loads(resp)
+
+
+def parse_batchexecute(response: bytes) -> list:
+    """Same as ``dialect.providers.modules.google.parse_batchexecute``."""
+    return [envelope for frame in jsonlib.loads_frames(response, BATCHEXECUTE_GUARD) for envelope in frame]
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonlib, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("counts_newline", [True, False])
+@pytest.mark.parametrize("text", TEXTS, ids=[f"text{index}" for index in range(len(TEXTS))])
+def test_matches_reference_parser(json_backend, text, counts_newline):
+    response = build_response(text, counts_newline)
+
+    envelopes = parse_batchexecute(response)
+
+    assert envelopes[:3] == reference_parse(response)
+    assert envelopes[-1][0] == "e"
+    assert jsonlib.loads(envelopes[0][2])[1][0][0][0] == text
+
+
+def test_without_guard(json_backend):
+    response = build_response("hello")
+
+    assert parse_batchexecute(response[len(b")]}'") :]) == parse_batchexecute(response)
@@ -0,0 +1,72 @@
+# Copyright 2026 The Dialect Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+# Load the module alone, the dialect.providers package needs gi
+_spec = importlib.util.spec_from_file_location(
+    "segments", Path(__file__).parents[1] / "dialect" / "providers" / "segments.py"
+)
+segments = importlib.util.module_from_spec(_spec)  # type: ignore
+_spec.loader.exec_module(segments)  # type: ignore
+
+WORDS = [
+    "a",
+    "word",
+    "longer",
+    "aaaaaaaaaaaaaaaaaaaaaaaa",
+    "end.",
+    "why?",
+    "so;",
+    "句子。",
+    "…",
+    " ",
+    "  ",
+    "\n",
+    "\n\n",
+    "\t",
+]
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(WORDS) + rng.choice(["", " ", "  ", " \n "]) for _ in range(rng.randrange(1, 120)))
+
+
+def check(text: str, limit: int) -> list[str]:
+    parts, separators = segments.split_text(text, limit)
+
+    assert len(separators) == len(parts) + 1
+    assert segments.join_segments(parts, separators) == text
+    for part in parts:
+        assert part.strip() == part != ""
+        assert len(part) <= limit
+    for separator in separators:
+        assert separator.strip() == ""
+
+    return parts
+
+
+@pytest.mark.parametrize(
+    "text, limit, expected",
+    [
+        ("aaaaaaaaaa  b", 10, ["aaaaaaaaaa", "b"]),
+        ("abcdefghij \nk", 10, ["abcdefghij", "k"]),
+        ("abcdefghij\n\nk", 10, ["abcdefghij", "k"]),
+        ("abcdefghijklmno", 10, ["abcdefghij", "klmno"]),
+        ("  one. two.  ", 10, ["one. two."]),
+        ("one two three four", 9, ["one two", "three", "four"]),
+        (" \n ", 10, []),
+    ],
+)
+def test_split_text(text, limit, expected):
+    assert check(text, limit) == expected
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_round_trip(seed):
+    rng = random.Random(seed)
+    check(random_text(rng), rng.randrange(30, 201))